@@ -60,13 +60,26 @@ def _write_json_safe(path: str, data: Any) -> None:
         raise
 
 
+def _version_file_mtime() -> int:
+    try:
+        return os.stat(VERSION_FP).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_data(show_spinner=False)
+def _data_version_cached(mtime_ns: int) -> str:
+    v = _read_json_safe(VERSION_FP, {"v": 0, "ts": 0})
+    return str(v.get("v", 0)) + "-" + str(v.get("ts", 0))
+
+
 def get_data_version() -> str:
     """
     Returns a monotonically increasing version string used to bust Streamlit caches.
     If the version file doesn't exist, returns '0-0'.
+    The file is only re-read when its mtime changes (e.g. after an Admin bump).
     """
-    v = _read_json_safe(VERSION_FP, {"v": 0, "ts": 0})
-    return str(v.get("v", 0)) + "-" + str(v.get("ts", 0))
+    return _data_version_cached(_version_file_mtime())
 
 
 def _read_json(rel_path: str) -> Any:
@@ -280,15 +293,45 @@ def rebuild_media_index() -> Dict[str, Dict[str, Any]]:
     return media_data
 
 
+def _media_dirs_signature() -> str:
+    """
+    Cheap fingerprint of MEDIA_SEARCH_DIRS: path and mtime of every file the
+    index records. Adding, removing, renaming or overwriting one changes it,
+    so it changes whenever the index (which stores each mtime as `ts`) would,
+    at the cost of one stat per file instead of a rescan and rewrite.
+    index.json itself is not an indexed type, so rewriting it doesn't count.
+    """
+    base_dir = os.getcwd()
+    indexed_exts = MEDIA_IMAGE_EXTENSIONS | MEDIA_BROCHURE_EXTENSIONS
+    parts: List[str] = []
+    for rel_dir in MEDIA_SEARCH_DIRS:
+        root = os.path.join(base_dir, rel_dir)
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                if os.path.splitext(name)[1].lower() not in indexed_exts:
+                    continue
+                fp = os.path.join(dirpath, name)
+                try:
+                    parts.append(f"{fp}:{os.stat(fp).st_mtime_ns}")
+                except OSError:
+                    continue
+    return "|".join(parts)
+
+
+@st.cache_data(show_spinner=False)
+def _load_media_index_cached(signature: str) -> Dict[str, Dict[str, Any]]:
+    return rebuild_media_index()
+
+
 def load_media_index() -> Dict[str, Dict[str, Any]]:
     """
     Public API for the rest of the app.
 
-    For simplicity (and to guarantee new assets show up automatically),
-    we always rebuild on call. If this ever becomes a bottleneck,
-    we can add caching/versioning later.
+    New assets still show up automatically: the index is rebuilt (and
+    index.json rewritten) only when a media file is added, removed, renamed
+    or modified, otherwise the cached copy is returned.
     """
-    return rebuild_media_index()
+    return _load_media_index_cached(_media_dirs_signature())
 
 
 @st.cache_data(show_spinner=False)
@@ -310,7 +310,6 @@ def render_section(
         # Inline required error
         if show_required_errors and field.get("required"):
             v = answers.get(name)
-            is_empty = (v is None) or (isinstance(v, str) and v.strip() == "") or (
-                isinstance(v, list) and len(v) == 0)
+            is_empty = v is None or v == "" or v == [] or (isinstance(v, str) and not v.strip())
             if is_empty:
                 st.caption(":red[This field is required.]")
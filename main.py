@@ -1,9 +1,17 @@
 import os
 import datetime
+import functools
+import hashlib
+import html
+import io
 import json
-from typing import Any, Dict, List, Optional
+import shutil
+from collections import ChainMap
+from typing import Any, Dict, List, Mapping, Optional
 
+import pandas as pd
 import streamlit as st
+from PIL import Image, ImageOps
 
 from data_loader import (
     load_catalog,
@@ -15,18 +23,44 @@ from data_loader import (
 from overrides import merge_overrides
 from form_renderer import apply_overrides as apply_field_overrides, render_section, seed_defaults, normalize_admin_fields  # newly added helper
 from visible_if import is_visible as visible_if_field, evaluate as visible_if_eval
-from pdf_builder import build_survey_pdf
 
 # ---------------- App Config ----------------
 
+DAYS = ("Monday", "Tuesday", "Wednesday",
+        "Thursday", "Friday", "Saturday", "Sunday")
+WEEKDAYS = DAYS[:5]
+WEEKEND = frozenset(DAYS[5:])
+
+# Default times and step for the time picker
+DEFAULT_OPEN_TIME = datetime.time(8, 0)   # 08:00
+DEFAULT_CLOSE_TIME = datetime.time(20, 0) # 20:00 (8 PM)
+TIME_STEP = datetime.timedelta(minutes=30)  # 30-minute increments
+# Hours editor column setup (one st.data_editor row per day)
+HOURS_COLUMNS = {
+    "Day": st.column_config.TextColumn("Day"),
+    "Closed": st.column_config.CheckboxColumn("Closed"),
+    "Open": st.column_config.TimeColumn("Open", format="HH:mm", step=TIME_STEP),
+    "Close": st.column_config.TimeColumn("Close", format="HH:mm", step=TIME_STEP),
+}
+
+# Section keys rendered by their own numbered blocks below
+DELIVERY_SECTION_KEYS = ("delivery_base", "smart_safe_additions")
+NUMBERED_SECTION_KEYS = frozenset(
+    {"contact_info", "installation_location", "site_info", *DELIVERY_SECTION_KEYS}
+)
+# Site-info field names that duplicate the dedicated Hours of Operation block
+STORE_HOURS_FIELD_NAMES = frozenset({"store_hours", "hours", "storehours"})
+
 # st.set_page_config(page_title="Site Survey Form", layout="centered")
 st.set_page_config(page_title="Site Survey Form", layout="wide", initial_sidebar_state="expanded")
 st.title("📋 Site Survey Form")
 
+# Page config and title must be re-emitted on every rerun (Streamlit drops
+# elements a run does not produce), so only the data reads are cached.
 # Load data-driven resources
 version = get_data_version()
 
-# 🔁 Always rebuild media index so index.json matches assets/ + data/media
+# 🔁 Rebuild media index whenever assets/ or data/media change
 media_index = load_media_index()
 
 catalog = load_catalog(version)
@@ -36,59 +70,158 @@ lang_map = load_lang("en", version)
 # --- Load Settings (branding + logo) ---
 SETTINGS_FP = os.path.join("data", "settings.json")
 
-def load_settings():
+def _settings_mtime() -> float:
+    try:
+        return os.path.getmtime(SETTINGS_FP)
+    except OSError:
+        return 0.0
+
+# mtime is only a cache key: editing settings.json invalidates the entry.
+# st.cache_data hands back a fresh copy per call, so callers may mutate it.
+@st.cache_data(show_spinner=False)
+def load_settings(mtime: float = 0.0):
     try:
         with open(SETTINGS_FP, "r", encoding="utf-8") as f:
             return json.load(f)
-    except:
+    except FileNotFoundError:
+        return {"branding": {}, "media": {}}
+    except (OSError, json.JSONDecodeError) as e:
+        st.warning(f"settings.json unreadable: {e}")
         return {"branding": {}, "media": {}}
 
-def _hero_path(filename: str | None):
-    """
-    Resolve a hero image filename to an absolute OS path.
-    Works locally AND on Streamlit Cloud.
-    """
-    if not filename:
-        return None
-
-    filename = filename.strip()
-    base = os.path.basename(filename)
+# Hero/logo search order: local dev paths first, then Streamlit Cloud mounts
+HERO_LOCAL_DIRS = (
+    os.path.join("data", "media"),
+    "assets",
+)
+HERO_CLOUD_DIRS = (
+    "/mount/src/site_survey/data/media",
+    "/mount/src/site_survey/assets",
+    "/mount/src/data/media",
+)
+HERO_SEARCH_DIRS = HERO_LOCAL_DIRS + HERO_CLOUD_DIRS
 
-    # Local dev paths
-    local_paths = [
-        os.path.join("data", "media", base),
-        os.path.join("assets", base),
-    ]
 
-    # Streamlit Cloud mount paths
-    cloud_paths = [
-        os.path.join("/mount/src/site_survey/data/media", base),
-        os.path.join("/mount/src/site_survey/assets", base),
-        os.path.join("/mount/src/data/media", base),
-    ]
+@functools.lru_cache(maxsize=128)
+def _resolve_hero(filename: str) -> str:
+    base = os.path.basename(filename)
 
     # Direct path provided?
     if os.path.isabs(filename) and os.path.exists(filename):
         return filename
 
-    # Try Local
-    for p in local_paths:
-        if os.path.exists(p):
-            return p
+    # Try Local, then Cloud-mounted paths; first hit wins.
+    # Not found — still return local path where it SHOULD be
+    candidates = (os.path.join(d, base) for d in HERO_SEARCH_DIRS)
+    return next((p for p in candidates if os.path.exists(p)), os.path.join(HERO_LOCAL_DIRS[0], base))
 
-    # Try Cloud-mounted paths
-    for p in cloud_paths:
-        if os.path.exists(p):
-            return p
 
-    # Not found — still return local path where it SHOULD be
-    return local_paths[0]
+# Hero images are published here once and served by Streamlit's static file server
+# (server.enableStaticServing) instead of being re-processed by st.image per rerun.
+STATIC_HERO_DIR = os.path.join("static", "hero")
+STATIC_HERO_URL = "app/static/hero"
+HERO_DISPLAY_W = 600
+HERO_VARIANT_WIDTHS = (480, 600, 900)
+# Mirrors the .hero-wrap max-width breakpoints below
+HERO_SIZES = "(max-width: 480px) 95vw, (max-width: 1024px) 480px, 600px"
+
+# ✅ Responsive hero image styles; sent with the hero markup in one element
+_HERO_CSS = """
+<style>
+.hero-wrap {
+  display: flex;
+  justify-content: center;
+  margin: 1rem 0;
+}
+.hero-wrap figure {
+  margin: 0;
+  text-align: center;
+}
+.hero-wrap figcaption {
+  font-size: 0.875rem;
+  opacity: 0.6;
+  margin-top: 0.375rem;
+}
+.hero-wrap img {
+  display: block;
+  width: 100% !important;
+  height: auto !important;
+  max-width: 600px !important;  /* hard cap on desktop */
+}
+
+/* Phone */
+@media (max-width: 480px) {
+  .hero-wrap img {
+    max-width: 95vw !important;
+  }
+}
+
+/* Tablet */
+@media (min-width: 481px) and (max-width: 1024px) {
+  .hero-wrap img {
+    max-width: 480px !important;
+  }
+}
+</style>
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _hero_static_img(image_path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Publish resized WebP variants of image_path under ./static (keyed on
+    path + mtime) and return the <img> attributes that reference them.
+    Falls back to a plain copy of the original if it cannot be decoded.
+    """
+    digest = hashlib.sha1(f"{image_path}|{mtime}".encode("utf-8")).hexdigest()[:16]
+    os.makedirs(STATIC_HERO_DIR, exist_ok=True)
+    try:
+        with Image.open(image_path) as img:
+            img_w, img_h = img.size
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            srcset = []
+            src = ""
+            for w in sorted({min(w, img_w) for w in HERO_VARIANT_WIDTHS}):
+                fname = f"{digest}-{w}.webp"
+                dest = os.path.join(STATIC_HERO_DIR, fname)
+                if not os.path.exists(dest):
+                    h = max(1, round(img_h * w / img_w))
+                    img.resize((w, h), Image.LANCZOS).save(dest, format="WEBP", quality=85)
+                srcset.append(f"{STATIC_HERO_URL}/{fname} {w}w")
+                if w <= HERO_DISPLAY_W or not src:
+                    src = f"{STATIC_HERO_URL}/{fname}"
+    except OSError:
+        fname = f"{digest}{os.path.splitext(image_path)[1].lower()}"
+        dest = os.path.join(STATIC_HERO_DIR, fname)
+        if not os.path.exists(dest):
+            shutil.copyfile(image_path, dest)
+        return {"src": f"{STATIC_HERO_URL}/{fname}", "srcset": "", "width": HERO_DISPLAY_W, "height": 0}
+
+    return {
+        "src": src,
+        "srcset": ", ".join(srcset),
+        "width": HERO_DISPLAY_W,
+        "height": round(img_h * HERO_DISPLAY_W / img_w),
+    }
+
+
+def _hero_path(filename: str | None):
+    """
+    Resolve a hero image filename to an absolute OS path.
+    Works locally AND on Streamlit Cloud. Lookups are memoized per process;
+    a missing file resolves to data/media/, which is where Admin uploads land.
+    """
+    filename = (filename or "").strip()
+    if not filename:
+        return None
+    return _resolve_hero(filename)
     
-settings = load_settings()
+settings = load_settings(_settings_mtime())
 
 # Extract the selected hero/logo file
 settings_logo = settings.get("media", {}).get("hero_image", "")
-settings_logo_path = _hero_path(settings_logo)
+settings_logo_path = _hero_path(settings_logo) if settings_logo else None
 # st.write("DEBUG: settings_logo =", settings_logo)
 # st.write("DEBUG: settings_logo_path =", settings_logo_path)
 
@@ -111,6 +244,16 @@ st.subheader(f"1. {lang_map.get('section.site_info', 'Site Information')}")
 makes_map: Dict[str, Dict[str, Any]] = catalog.get("makes", {}) or {}
 
 
+@st.cache_data(show_spinner=False)
+def _catalog_options(version: str) -> Dict[str, List[str]]:
+    """Make key -> model keys in catalog order; rebuilt only when the data version changes."""
+    makes = load_catalog(version).get("makes", {}) or {}
+    return {mk: list(((m or {}).get("models") or {}).keys()) for mk, m in makes.items()}
+
+
+catalog_options = _catalog_options(version)
+
+
 def make_label(k: str) -> str:
     return (makes_map.get(k) or {}).get("label", k)
 
@@ -119,28 +262,35 @@ def model_label(mk: str, mdk: str) -> str:
     return ((makes_map.get(mk) or {}).get("models", {}).get(mdk) or {}).get("label", mdk)
 
 
+_CAT_SLUG = str.maketrans({"-": "_"})
+_CATKEY_TRANS = str.maketrans({"-": "_", " ": "_"})
+_CAT_WORDS = str.maketrans({"_": " "})
+_CAT_MAP = {
+    "smart_safe": "Smart Safe",
+    "smart safe": "Smart Safe",
+    "recycler": "Recycler",
+    "dispenser": "Dispenser",
+    "note_sorter": "Note Sorter",
+    "note sorter": "Note Sorter",
+}
+
+
 def normalize_category(c: str) -> str:
     if not c:
         return ""
-    slug = str(c).strip().lower().replace("-", "_")
-    mapping = {
-        "smart_safe": "Smart Safe",
-        "smart safe": "Smart Safe",
-        "recycler": "Recycler",
-        "dispenser": "Dispenser",
-        "note_sorter": "Note Sorter",
-        "note sorter": "Note Sorter",
-    }
-    if slug in mapping:
-        return mapping[slug]
-    # Fallback: Title Case derived from slug
-    return " ".join(w.capitalize() for w in slug.replace("_", " ").split())
+    slug = str(c).strip().lower().translate(_CAT_SLUG)
+    label = _CAT_MAP.get(slug)
+    if label is not None:
+        return label
+    # Fallback: Title Case derived from slug (capitalize, unlike str.title,
+    # leaves letters after digits alone: "d3xl" -> "D3xl")
+    return " ".join(w.capitalize() for w in slug.translate(_CAT_WORDS).split())
 
 
 # Make selector
 make_key = st.selectbox(
     "Make",
-    options=list(makes_map.keys()),
+    options=list(catalog_options),
     format_func=lambda k: make_label(k),
     key="make_sel",
 ) if makes_map else None
@@ -150,7 +300,7 @@ models_map_for_make: Dict[str, Dict[str, Any]] = (
     makes_map.get(make_key) or {}).get("models", {}) if make_key else {}
 model_key = st.selectbox(
     "Model",
-    options=list(models_map_for_make.keys()),
+    options=catalog_options.get(make_key) or [],
     format_func=lambda k: model_label(make_key, k),
     key="model_sel",
 ) if models_map_for_make else None
@@ -195,43 +345,31 @@ st.markdown(f"**Height:** {model_height}")
 
 # (already resolved above)
 
-# ✅ Responsive hero image without breaking st.image
-st.markdown("""
-<style>
-.hero-wrap {
-  display: flex;
-  justify-content: center;
-  margin: 1rem 0;
-}
-.hero-wrap img {
-  display: block;
-  width: 100% !important;
-  height: auto !important;
-  max-width: 600px !important;  /* hard cap on desktop */
-}
-
-/* Phone */
-@media (max-width: 480px) {
-  .hero-wrap img {
-    max-width: 95vw !important;
-  }
-}
 
-/* Tablet */
-@media (min-width: 481px) and (max-width: 1024px) {
-  .hero-wrap img {
-    max-width: 480px !important;
-  }
-}
-</style>
-""", unsafe_allow_html=True)
 
+try:
+    # One stat for both the existence check and the cache key
+    image_mtime = os.stat(image_path).st_mtime if image_path else None
+except OSError:
+    image_mtime = None
 
-if image_path and os.path.exists(image_path):
-    st.markdown('<div class="hero-wrap">', unsafe_allow_html=True)
-    # hard cap the width; Streamlit will scale down, not up
-    st.image(image_path, caption=f"{make} {model}", width=600)
-    st.markdown('</div>', unsafe_allow_html=True)
+if image_mtime is not None:
+    hero = _hero_static_img(image_path, image_mtime)
+    hero_caption = html.escape(f"{make} {model}")
+    hero_srcset = (
+        f' srcset="{hero["srcset"]}" sizes="{HERO_SIZES}"' if hero["srcset"] else ""
+    )
+    hero_height = f' height="{hero["height"]}"' if hero["height"] else ""
+    # hard cap the width via .hero-wrap CSS; width/height only reserve the aspect ratio
+    st.markdown(
+        _HERO_CSS +
+        f'<div class="hero-wrap"><figure>'
+        f'<img src="{hero["src"]}"{hero_srcset} alt="{hero_caption}" '
+        f'width="{hero["width"]}"{hero_height} loading="lazy" decoding="async">'
+        f'<figcaption>{hero_caption}</figcaption>'
+        f'</figure></div>',
+        unsafe_allow_html=True,
+    )
 
 
 # Prepare composed sections for current selection
@@ -241,19 +379,32 @@ category_sections = (qdef.get("category_packs", {})
 sections_composed = base_sections + category_sections
 
 # Merge overrides and apply to sections
-merged = merge_overrides(qdef, category=category, make=make, model=model)
+@st.cache_data(show_spinner=False)
+def _merged_overrides(version: str, category: str, make: str, model: str) -> Dict[str, Any]:
+    """Scope-merged overrides per selection; each rerun gets its own copy, so callers may mutate it."""
+    return merge_overrides(load_questions(version), category=category, make=make, model=model)
+
+
+merged = _merged_overrides(version, category, make, model)
 sections_used = apply_field_overrides(sections_composed, merged)
 
+# Index sections by key once (first occurrence wins, as the old scans did)
+sec_by_key: Dict[str, Dict[str, Any]] = {}
+for _sec in sections_used:
+    sec_by_key.setdefault(_sec.get("key"), _sec)
+
 # ---- Inject Admin-defined fields (Category -> "Delivery") into the composed sections ----
 # Derive cat_key in the same shape Admin uses as a top-level key in questions.json.
 # Admin saves under lowercase slug with underscores (e.g., "smart_safe").
 def _to_cat_key(label: str, model_meta: Dict[str, Any]) -> str:
     # Prefer the original model-provided category slug if present (e.g., "smart_safe")
     raw = (model_meta or {}).get("category")
-    if isinstance(raw, str) and raw.strip():
-        return raw.strip().lower().replace("-", "_")
+    if isinstance(raw, str):
+        raw = raw.strip()
+        if raw:
+            return raw.lower().translate(_CAT_SLUG)
     # Fallback from normalized Category label ("Smart Safe" -> "smart_safe")
-    return (label or "").strip().lower().replace("-", "_").replace(" ", "_")
+    return (label or "").strip().lower().translate(_CATKEY_TRANS)
 
 cat_key = _to_cat_key(category, model_meta)
 admin_fields_delivery = normalize_admin_fields(cat_key, "Delivery", qdef)
@@ -261,16 +412,11 @@ admin_fields_delivery = normalize_admin_fields(cat_key, "Delivery", qdef)
 if admin_fields_delivery:
     # Find a target section to receive these. For Smart Safe we prefer "smart_safe_additions",
     # otherwise we fall back to the base delivery block.
-    target = None
-    for sec in sections_used:
-        if sec.get("key") == "smart_safe_additions":
-            target = sec
-            break
-    if target is None:
-        for sec in sections_used:
-            if sec.get("key") == "delivery_base" or sec.get("title_key") == "section.delivery":
-                target = sec
-                break
+    target = (
+        sec_by_key.get("smart_safe_additions")
+        or sec_by_key.get("delivery_base")
+        or next((sec for sec in sections_used if sec.get("title_key") == "section.delivery"), None)
+    )
     if target is not None:
         target.setdefault("fields", []).extend(admin_fields_delivery)
 
@@ -306,24 +452,51 @@ photos_all = st.file_uploader(
     accept_multiple_files=True
 )
 
+THUMB_W = 140
+# Encode previews at 2x the displayed width so they stay sharp on HiDPI screens
+THUMB_PX = THUMB_W * 2
+
+
+@st.cache_data(show_spinner=False)
+def _photo_thumbnail(name: str, size: int, head_digest: str, _photo: Any) -> bytes:
+    """
+    Downscale an uploaded photo to a THUMB_PX-wide JPEG once; later reruns hit
+    the cache (keyed on name, size and a digest of the first 4 KB).
+    """
+    _photo.seek(0)
+    with Image.open(_photo) as img:
+        img.draft("RGB", (THUMB_PX, THUMB_PX))
+        thumb = img.convert("RGB")
+    # Match the PDF: honor phone EXIF rotation so previews aren't sideways
+    ImageOps.exif_transpose(thumb, in_place=True)
+    thumb.thumbnail((THUMB_PX, THUMB_PX * 4), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    thumb.save(buf, format="JPEG", quality=75)
+    _photo.seek(0)
+    return buf.getvalue()
+
+
 accepted_photos: List[Any] = []
 if photos_all:
     too_many = len(photos_all) > max_count
     if too_many:
         st.error(
             f"Too many photos. {len(photos_all)} uploaded; maximum is {max_count}. Extra files will be ignored.")
+    # str.endswith takes a tuple; compare raw byte sizes against a byte limit
+    allowed_exts_tuple = tuple(ext.lower() for ext in allowed_exts)
+    allowed_exts_text = ", ".join(allowed_exts)
+    max_bytes = max_mb_each * 1024 * 1024
     for photo in photos_all[:max_count]:
         # Validate extension
-        name_lower = photo.name.lower()
-        if not any(name_lower.endswith(ext) for ext in allowed_exts):
+        if not photo.name.lower().endswith(allowed_exts_tuple):
             st.error(
-                f"File {photo.name} has an invalid extension. Allowed: {', '.join(allowed_exts)}")
+                f"File {photo.name} has an invalid extension. Allowed: {allowed_exts_text}")
             continue
         # Validate size
-        size_mb = (photo.size or 0) / (1024 * 1024)
-        if size_mb > max_mb_each:
+        size = photo.size or 0
+        if size > max_bytes:
             st.error(
-                f"File {photo.name} exceeds max size of {max_mb_each} MB (got {size_mb:.1f} MB).")
+                f"File {photo.name} exceeds max size of {max_mb_each} MB (got {size / (1024 * 1024):.1f} MB).")
             continue
         accepted_photos.append(photo)
 
@@ -336,53 +509,54 @@ if accepted_photos:
     for i, photo in enumerate(accepted_photos):
         with cols[i % 5]:
             try:
-                st.image(photo, caption=photo.name, width=140)
+                thumb = _photo_thumbnail(
+                    photo.name,
+                    photo.size,
+                    hashlib.sha1(photo.getbuffer()[:4096]).hexdigest(),
+                    photo,
+                )
+                st.image(thumb, caption=photo.name, width=THUMB_W)
             except Exception:
                 pass
 
 # --- Site Information ---
 st.subheader(f"3. {lang_map.get('section.site_info', 'Site Information')}")
-for _sec in sections_used:
-    if _sec.get("key") == "site_info":
-        # Remove any "Store Hours" style field from this section
-        def _skip_store_hours(f):
-            name = (f.get("name") or "").strip().lower()
-            label = (lang_map.get(f.get("label_key") or "",
-                     f.get("label") or "") or "").strip().lower()
-            return name not in {"store_hours", "hours", "storehours"} and "store hours" not in label
-
+_sec = sec_by_key.get("site_info")
+if _sec is not None:
+    # Remove any "Store Hours" style field from this section
+    # Name check first; the label lookup only runs for fields that pass it
+    def _skip_store_hours(f):
+        if (f.get("name") or "").strip().lower() in STORE_HOURS_FIELD_NAMES:
+            return False
+        label = lang_map.get(f.get("label_key") or "", f.get("label") or "") or ""
+        return "store hours" not in label.lower()
+
+    _fields = _sec.get("fields") or []
+    _kept = [f for f in _fields if _skip_store_hours(f)]
+    if len(_kept) == len(_fields):
+        sec_no_hours = _sec
+    else:
         sec_no_hours = dict(_sec)
-        sec_no_hours["fields"] = [f for f in (
-            _sec.get("fields") or []) if _skip_store_hours(f)]
+        sec_no_hours["fields"] = _kept
 
-        render_section(
-            sec_no_hours, answers, lang=lang_map, category=category, make=make, model=model,
-            show_required_errors=bool(
-                st.session_state.get('_show_required_errors'))
-        )
-        break
+    render_section(
+        sec_no_hours, answers, lang=lang_map, category=category, make=make, model=model,
+        show_required_errors=bool(
+            st.session_state.get('_show_required_errors'))
+    )
 
 
 # --- Contact Info ---
 st.subheader(
     f"4. {lang_map.get('section.contact_info', 'Contact Information')}")
-for _sec in sections_used:
-    if _sec.get("key") == "contact_info":
-        render_section(_sec, answers, lang=lang_map, category=category, make=make, model=model,
-                       show_required_errors=bool(st.session_state.get('_show_required_errors')))
-        break
+_sec = sec_by_key.get("contact_info")
+if _sec is not None:
+    render_section(_sec, answers, lang=lang_map, category=category, make=make, model=model,
+                   show_required_errors=bool(st.session_state.get('_show_required_errors')))
 
 # --- Hours of Operation ---
 st.subheader("5. Hours of Operation")
 
-days = ["Monday", "Tuesday", "Wednesday",
-        "Thursday", "Friday", "Saturday", "Sunday"]
-
-# Default times and step for the time picker
-DEFAULT_OPEN_TIME = datetime.time(8, 0)   # 08:00
-DEFAULT_CLOSE_TIME = datetime.time(20, 0) # 20:00 (8 PM)
-TIME_STEP = datetime.timedelta(minutes=30)  # 30-minute increments
-
 # ---------- Quick presets (optional) ----------
 st.markdown("**Quick Setup (optional)**")
 
@@ -406,67 +580,52 @@ with qp_cols[3]:
         step=TIME_STEP,
     )
 
-if st.button("Apply to selected days", key="apply_hours_presets"):
-    # Apply Mon–Fri block
-    if same_weekdays:
-        for d in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]:
-            st.session_state[f"open_{d}"] = weekday_open
-            st.session_state[f"close_{d}"] = weekday_close
-            st.session_state[f"closed_{d}"] = False
-    # Close weekend
-    if weekend_closed:
-        for d in ["Saturday", "Sunday"]:
-            st.session_state[f"closed_{d}"] = True
+apply_presets = st.button("Apply to selected days", key="apply_hours_presets")
 
 st.markdown("---")
 
-# ---------- Per-day hours w/ Closed checkbox ----------
-hours: Dict[str, Any] = {}
-
-for day in days:
-    open_key = f"open_{day}"
-    close_key = f"close_{day}"
-    closed_key = f"closed_{day}"
-
-    # Seed defaults only once per session
-    if open_key not in st.session_state:
-        st.session_state[open_key] = DEFAULT_OPEN_TIME
-    if close_key not in st.session_state:
-        st.session_state[close_key] = DEFAULT_CLOSE_TIME
+# ---------- Per-day hours: one editable table ----------
+# Rows live in session_state; the editor key carries a revision so a
+# preset rewrite can replace the table without fighting its edit state.
+_ss = st.session_state
+_ss.setdefault("hours_rows", [
     # Default weekends to closed, weekdays to open
-    if closed_key not in st.session_state:
-        st.session_state[closed_key] = day in {"Saturday", "Sunday"}
-
-    cols = st.columns([1.1, 0.9, 1.5, 1.5])
-
-    with cols[0]:
-        st.markdown(f"**{day}**")
-
-    with cols[1]:
-        closed = st.checkbox("Closed", key=closed_key)
-
-    with cols[2]:
-        open_time = st.time_input(
-            f"Open {day}",
-            key=open_key,
-            step=TIME_STEP,
-            disabled=closed,
-        )
-
-    with cols[3]:
-        close_time = st.time_input(
-            f"Close {day}",
-            key=close_key,
-            step=TIME_STEP,
-            disabled=closed,
-        )
-
-    # Store a richer structure so PDF knows about "closed"
-    hours[day] = {
-        "open": None if closed else open_time,
-        "close": None if closed else close_time,
-        "closed": closed,
-    }
+    {"Day": day, "Closed": day in WEEKEND, "Open": DEFAULT_OPEN_TIME, "Close": DEFAULT_CLOSE_TIME}
+    for day in DAYS
+])
+_ss.setdefault("hours_rev", 0)
+hours_rows = st.data_editor(
+    pd.DataFrame(_ss["hours_rows"]),
+    key=f"hours_editor_{_ss['hours_rev']}",
+    column_config=HOURS_COLUMNS,
+    disabled=["Day"],
+    hide_index=True,
+    num_rows="fixed",
+    use_container_width=True,
+).to_dict("records")
+
+if apply_presets:
+    for row in hours_rows:
+        # Apply Mon–Fri block
+        if same_weekdays and row["Day"] in WEEKDAYS:
+            row.update(Open=weekday_open, Close=weekday_close, Closed=False)
+        # Close weekend
+        if weekend_closed and row["Day"] in WEEKEND:
+            row["Closed"] = True
+    _ss["hours_rows"] = hours_rows
+    _ss.pop(f"hours_editor_{_ss['hours_rev']}", None)
+    _ss["hours_rev"] += 1
+    st.rerun()
+
+# Store a richer structure so PDF knows about "closed"
+hours: Dict[str, Any] = {
+    row["Day"]: (
+        {"open": None, "close": None, "closed": True}
+        if row["Closed"]
+        else {"open": row["Open"], "close": row["Close"], "closed": False}
+    )
+    for row in hours_rows
+}
 
 answers["hours"] = hours
 
@@ -474,14 +633,15 @@ answers["hours"] = hours
 
 # --- Delivery Instructions ---
 st.subheader(f"6. {lang_map.get('section.delivery', 'Delivery Instructions')}")
-for _sec in sections_used:
-    if _sec.get("key") in ("delivery_base", "smart_safe_additions"):
+for _key in DELIVERY_SECTION_KEYS:
+    _sec = sec_by_key.get(_key)
+    if _sec is not None:
         render_section(_sec, answers, lang=lang_map, category=category, make=make, model=model,
                        show_required_errors=bool(st.session_state.get('_show_required_errors')))
 
 # --- Additional Category Sections ---
 for _sec in sections_used:
-    if _sec.get("key") not in ("contact_info", "installation_location", "site_info", "delivery_base", "smart_safe_additions"):
+    if _sec.get("key") not in NUMBERED_SECTION_KEYS:
         sec_title = lang_map.get(
             _sec.get("title_key", ""), _sec.get("title", ""))
         if sec_title:
@@ -492,34 +652,61 @@ for _sec in sections_used:
 # --- Installation Location ---
 st.subheader(
     f"7. {lang_map.get('section.installation_location', 'Installation Location')}")
-for _sec in sections_used:
-    if _sec.get("key") == "installation_location":
-        render_section(_sec, answers, lang=lang_map, category=category, make=make, model=model,
-                       show_required_errors=bool(st.session_state.get('_show_required_errors')))
-        break
+_sec = sec_by_key.get("installation_location")
+if _sec is not None:
+    render_section(_sec, answers, lang=lang_map, category=category, make=make, model=model,
+                   show_required_errors=bool(st.session_state.get('_show_required_errors')))
+
+generate_clicked = st.button("📄 Generate PDF")
 
 # ---------------- Submit -> Validate -> Build PDF ----------------
 
-def _collect_missing_required(sections: List[Dict[str, Any]], state: Dict[str, Any]) -> List[str]:
+def _collect_missing_required(sections: List[Dict[str, Any]], state: Mapping[str, Any]) -> List[str]:
     missing: List[str] = []
+    # Bind hot-loop globals to locals once
+    _vif = visible_if_field
+    cat, mk, md = category, make, model
     for sec in sections:
         for fld in sec.get("fields", []) or []:
             if not fld.get("required"):
                 continue
-            if not visible_if_field(fld, state, category, make, model):
+            if not _vif(fld, state, cat, mk, md):
                 continue
             v = state.get(fld.get("name"))
-            is_empty = (v is None) or (isinstance(v, str) and v.strip() == "") or (
-                isinstance(v, list) and len(v) == 0)
+            is_empty = v is None or v == "" or v == [] or (isinstance(v, str) and not v.strip())
             if is_empty:
                 missing.append(fld.get("name"))
     return missing
 
 
-if st.button("📄 Generate PDF"):
-    # Merge collected inputs into session_state-based answers for validation
-    validate_state = dict(st.session_state)
-    validate_state.update(answers)
+def _pdf_inputs_key(validate_state: Mapping[str, Any]) -> str:
+    """
+    Fingerprint everything the PDF is built from, so a repeat click with
+    unchanged inputs can reuse the last bytes instead of rebuilding.
+    """
+    snapshot = {
+        "version": version,
+        "date": datetime.date.today(),
+        "answers": {k: v for k, v in answers.items() if k != "photos"},
+        "ids": [validate_state.get(k) for k in ("company", "site_id", "store_name")],
+        "equipment": [make, model, category, model_weight, model_width, model_depth, model_height],
+        "images": [image_path, settings_logo_path],
+        # Upload ids are unique per uploaded file, so there's no need to hash bytes
+        "photos": [
+            getattr(p, "file_id", None) or hashlib.sha1(p.getbuffer()).hexdigest()
+            for p in accepted_photos[:max_count]
+        ],
+    }
+    blob = json.dumps(snapshot, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+if generate_clicked:
+    # Imported on first click so fpdf isn't loaded for reruns that never export
+    from pdf_builder import build_survey_pdf
+
+    # Read-only overlay: collected inputs win over session_state, no copy made
+    validate_state = ChainMap(answers, st.session_state)
 
     missing_fields = _collect_missing_required(sections_used, validate_state)
     # Non-blocking: highlight missing but continue generating the report
@@ -529,25 +716,32 @@ if st.button("📄 Generate PDF"):
             "Some recommended fields are missing. The report will still be generated."
         )
 
-    # Delegate PDF construction + filename logic to dedicated builder
-    pdf_bytes, file_name = build_survey_pdf(
-        answers=answers,
-        sections_used=sections_used,
-        hours=hours,
-        validate_state=validate_state,
-        make=make,
-        model=model,
-        model_weight=model_weight,
-        model_width=model_width,
-        model_depth=model_depth,
-        model_height=model_height,
-        image_path=image_path,
-        settings_logo_path=settings_logo_path,
-        accepted_photos=accepted_photos,
-        max_count=max_count,
-        lang_map=lang_map,
-        category=category,
-    )
+    # Delegate PDF construction + filename logic to dedicated builder;
+    # unchanged inputs reuse this session's last build
+    pdf_key = _pdf_inputs_key(validate_state)
+    last_pdf = st.session_state.get("_last_pdf")
+    if last_pdf and last_pdf[0] == pdf_key:
+        _, pdf_bytes, file_name = last_pdf
+    else:
+        pdf_bytes, file_name = build_survey_pdf(
+            answers=answers,
+            sections_used=sections_used,
+            hours=hours,
+            validate_state=validate_state,
+            make=make,
+            model=model,
+            model_weight=model_weight,
+            model_width=model_width,
+            model_depth=model_depth,
+            model_height=model_height,
+            image_path=image_path,
+            settings_logo_path=settings_logo_path,
+            accepted_photos=accepted_photos,
+            max_count=max_count,
+            lang_map=lang_map,
+            category=category,
+        )
+        st.session_state["_last_pdf"] = (pdf_key, pdf_bytes, file_name)
 
     st.success(
         "PDF generated successfully. Please download it below and, once confirmed, email the PDF to your Area Manager."
@@ -11,6 +11,10 @@ class OverrideOut(TypedDict):
     insert_after: List[Dict[str, Any]]
 
 
+# insert_after entries must carry at least these keys
+_REQUIRED_INSERT_KEYS = frozenset({"after", "field"})
+
+
 def _normalize_scope_name(s: str) -> str:
     # Defensive normalization (strip spaces); input is trusted from questions.json
     return (s or "").strip()
@@ -36,26 +40,28 @@ def merge_overrides(qdef: Dict[str, Any], category: str, make: str, model: str)
       - insert_after: concatenate (preserve order; later scopes appended)
     Returns a normalized structure with sets for required/hide_fields.
     """
-    ov_map: Dict[str, Any] = (qdef.get("overrides") or {})
-    scopes: List[str] = [
-        "*",
-        f"category:{category}",
-        f"make:{make}",
-        f"model:{make}|{model}",
-    ]
-
     out: OverrideOut = _empty()
+    ov_map: Dict[str, Any] = (qdef.get("overrides") or {})
+    if not ov_map:
+        return out
 
-    for s in scopes:
-        scope = _normalize_scope_name(s)
-        ov = ov_map.get(scope)
+    scopes = (
+        "*",
+        _normalize_scope_name(f"category:{category}"),
+        _normalize_scope_name(f"make:{make}"),
+        _normalize_scope_name(f"model:{make}|{model}"),
+    )
+    get_scope = ov_map.get
+
+    for scope in scopes:
+        ov = get_scope(scope)
         if not ov:
             continue
 
         # required (list[str] -> set union)
         req = ov.get("required")
         if isinstance(req, list):
-            out["required"].update([str(x) for x in req])
+            out["required"].update(map(str, req))
 
         # defaults (dict -> merge with overwrite)
         defs = ov.get("defaults")
@@ -65,14 +71,15 @@ def merge_overrides(qdef: Dict[str, Any], category: str, make: str, model: str)
         # hide_fields (list[str] -> set union)
         hides = ov.get("hide_fields")
         if isinstance(hides, list):
-            out["hide_fields"].update([str(x) for x in hides])
+            out["hide_fields"].update(map(str, hides))
 
         # insert_after (list[{"after": str, "field": {...}}]) -> concat
         inserts = ov.get("insert_after")
         if isinstance(inserts, list):
             # Shallow validation: only accept dicts with at least "after" and "field"
-            for item in inserts:
-                if isinstance(item, dict) and "after" in item and "field" in item:
-                    out["insert_after"].append(item)
+            out["insert_after"].extend(
+                item for item in inserts
+                if isinstance(item, dict) and _REQUIRED_INSERT_KEYS <= item.keys()
+            )
 
     return out
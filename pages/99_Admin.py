@@ -41,15 +41,21 @@ from __future__ import annotations
 import os
 import io
 import re
+import functools
 import json
 import time
-import shutil
 import zipfile
-from dataclasses import dataclass, asdict
 from typing import Dict, List, Any, Optional, Tuple
 
+try:
+    import fcntl
+except ImportError:  # Windows: version bumps go unlocked
+    fcntl = None
+
 import pandas as pd
 import streamlit as st
+import PIL
+from PIL import Image, features as pil_features
 from app.ui import wide_button
 
 from data_loader import (
@@ -134,13 +140,39 @@ def resolve_image_path(filename: str) -> Optional[str]:
     return None
 
 
+PREVIEW_W = 250
+
+
+@st.cache_data(show_spinner=False)
+def preview_image(path: str, mtime: float, width: int = PREVIEW_W) -> bytes:
+    """
+    Downscaled copy of a media image for st.image previews (2x width for
+    HiDPI). Keyed on mtime, so it is only re-encoded when the file changes.
+    """
+    with Image.open(path) as img:
+        img.thumbnail((width * 2, width * 20), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        if img.mode in ("RGBA", "LA", "P"):
+            img.save(buf, format="PNG", optimize=True)
+        else:
+            img.convert("RGB").save(buf, format="JPEG", quality=85, optimize=True)
+    return buf.getvalue()
+
+
 # ---- File I/O helpers (atomic-ish writes) ----
 
 
+@st.cache_data(show_spinner=False)
+def _load_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    # (mtime_ns, size) is only the cache key; each call gets its own copy
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def _read_json(path: str, default: Any) -> Any:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        info = os.stat(path)
+        return _load_json_file(path, info.st_mtime_ns, info.st_size)
     except FileNotFoundError:
         return default
     except json.JSONDecodeError:
@@ -149,19 +181,83 @@ def _read_json(path: str, default: Any) -> Any:
         return default
 
 
-def _write_json(path: str, data: Any) -> None:
+# Directories whose renames have not been fsynced yet (see flush_writes)
+_pending_dir_fsyncs: set = set()
+
+
+def _write_json(path: str, data: Any) -> bool:
+    """Atomically replace `path`; returns False without touching it if the content is unchanged."""
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp, path)
+    _pending_dir_fsyncs.add(os.path.dirname(path) or ".")
+    return True
+
+
+def flush_writes() -> None:
+    """
+    Make the renames from _write_json durable with one fsync per directory,
+    so a save that writes several files in data/ syncs it only once.
+    """
+    dirs = list(_pending_dir_fsyncs)
+    _pending_dir_fsyncs.clear()
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows can't open a directory for fsync
+    for d in dirs:
+        try:
+            fd = os.open(d, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _save_upload(f: Any, out: str) -> bool:
+    """
+    Write an UploadedFile to `out` straight from its buffer. Returns False,
+    leaving the file (and its mtime-keyed caches) alone, if identical bytes are already there.
+    """
+    with f.getbuffer() as view:
+        try:
+            if os.path.getsize(out) == view.nbytes:
+                with open(out, "rb") as existing:
+                    if existing.read() == view:
+                        return False
+        except OSError:
+            pass
+        with open(out, "wb") as w:
+            w.write(view)
+    return True
 
 
 def bump_data_version() -> dict:
     """Increment data/version.json to bust all @st.cache_data loaders that depend on version."""
-    cur = _read_json(VERSION_FP, {"v": 0, "ts": 0})
-    cur["v"] = int(cur.get("v", 0)) + 1
-    cur["ts"] = int(time.time())
-    _write_json(VERSION_FP, cur)
+    # Serialize the read-modify-write so concurrent saves can't lose a bump
+    with open(VERSION_FP + ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        # Read uncached: back-to-back bumps can share an mtime tick and size
+        try:
+            with open(VERSION_FP, "r", encoding="utf-8") as f:
+                cur = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            cur = {"v": 0, "ts": 0}
+        cur["v"] = int(cur.get("v", 0)) + 1
+        cur["ts"] = int(time.time())
+        _write_json(VERSION_FP, cur)
+        flush_writes()
     try:
         st.cache_data.clear()
     except Exception:
@@ -175,21 +271,38 @@ def _mtime(path: str) -> float:
     except OSError:
         return 0.0
 
+
+def _json_preview(obj: Any, limit: int = 2000) -> str:
+    """First `limit` chars of json.dumps(obj, indent=2), without serializing the rest."""
+    parts: List[str] = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
 # ---- Slug & validation helpers ----
 
 
+SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+# Import rows repeat the same make (and often model) names
+@functools.lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
-    s = re.sub(r"[^a-zA-Z0-9]+", "_", text.strip()).strip("_")
+    s = SLUG_RE.sub("_", text.strip()).strip("_")
     return s.lower()
 
 
-def ensure_unique(seq: List[str]) -> Tuple[bool, Optional[str]]:
-    seen = set()
-    for x in seq:
-        if x in seen:
-            return False, x
-        seen.add(x)
-    return True, None
+def ensure_unique_series(col: pd.Series) -> Tuple[bool, Optional[str]]:
+    """(ok, first duplicate) for an editor key column; the duplicate scan runs in pandas."""
+    keys = col.astype(str)
+    dup = keys[keys.duplicated()]
+    if dup.empty:
+        return True, None
+    return False, dup.iat[0]
 
 
 def _as_str(x) -> str:
@@ -297,6 +410,17 @@ def rebuild_derived_catalog_structures(catalog: dict, categories: dict) -> dict:
     return catalog
 
 
+def save_catalog(catalog: dict, categories: dict) -> dict:
+    """
+    Normalize and persist the catalog in one write, then bump the data version.
+    Handlers mutate the in-memory catalog and call this once per click.
+    """
+    catalog = rebuild_derived_catalog_structures(catalog, categories)
+    if _write_json(CATALOG_FP, catalog):
+        bump_data_version()
+    return catalog
+
+
 # -----------------------------
 # Default structures
 # -----------------------------
@@ -318,14 +442,6 @@ DEFAULT_QUESTIONS = {
     # e.g., "smart_safe": {"Delivery": [{"key":"dock_height","label":"Dock height (in)","type":"number","required":False}]}
 }
 
-DEFAULT_USERS = {
-    "roles": ["admin", "editor", "viewer"],
-    "users": [
-        {"email": "admin@example.com", "name": "Admin",
-            "role": "admin", "active": True}
-    ],
-}
-
 DEFAULT_SETTINGS = {
     "branding": {
         "company_name": "CashTech Currency Products",
@@ -362,6 +478,7 @@ if coerced_makes != original_makes:
     catalog["makes"] = coerced_makes
     catalog = rebuild_derived_catalog_structures(catalog, categories)
     _write_json(CATALOG_FP, catalog)
+    flush_writes()
 else:
     # Defensive: ensure legacy fields exist even if shape was already correct
     catalog = rebuild_derived_catalog_structures(catalog, categories)
@@ -479,8 +596,8 @@ with TAB[0]:
     st.write(
         "Makes → Models → (optional) Variants. Attach category and dimensions per model.")
 
-    makes: Dict[str, Any] = _coerce_makes_map(catalog.get("makes", {}))
-    catalog["makes"] = makes  # keep in-memory consistent
+    # Already normalized by the boot block above
+    makes: Dict[str, Any] = catalog.setdefault("makes", {})
 
     col1, col2 = st.columns([1, 2], vertical_alignment="top")
     with col1:
@@ -495,43 +612,35 @@ with TAB[0]:
                     st.error("Make already exists.")
                 else:
                     makes[sk] = {"label": make_new.strip(), "models": {}}
-                    catalog = rebuild_derived_catalog_structures(
-                        catalog, categories)
-                    _write_json(CATALOG_FP, catalog)
-                    bump_data_version()
+                    catalog = save_catalog(catalog, categories)
                     st.success(f"Added make: {make_new}")
                     st.rerun()
 
         if makes:
-            make_keys = [k for k in makes.keys()]
-            make_labels = [makes[k].get("label", k) for k in make_keys]
+            make_keys = list(makes)
+            make_labels = [mv.get("label", k) for k, mv in makes.items()]
             idx = st.selectbox("Select make", options=list(
                 range(len(make_keys))), format_func=lambda i: make_labels[i])
             sel_make_key = make_keys[idx]
+            make_obj: Dict[str, Any] = makes[sel_make_key]
         else:
             sel_make_key = None
 
         if sel_make_key:
             with st.expander("Rename / Delete make"):
                 new_label = st.text_input(
-                    "Make label", value=makes[sel_make_key].get("label", sel_make_key))
+                    "Make label", value=make_obj.get("label", sel_make_key))
                 c1, c2 = st.columns(2)
                 with c1:
                     if wide_button("💾 Save make"):
-                        makes[sel_make_key]["label"] = new_label.strip(
-                        ) or makes[sel_make_key]["label"]
-                        catalog = rebuild_derived_catalog_structures(
-                            catalog, categories)
-                        _write_json(CATALOG_FP, catalog)
-                        bump_data_version()
+                        make_obj["label"] = new_label.strip(
+                        ) or make_obj["label"]
+                        catalog = save_catalog(catalog, categories)
                         st.success("Saved.")
                 with c2:
                     if wide_button("🗑️ Delete make"):
                         del makes[sel_make_key]
-                        catalog = rebuild_derived_catalog_structures(
-                            catalog, categories)
-                        _write_json(CATALOG_FP, catalog)
-                        bump_data_version()
+                        catalog = save_catalog(catalog, categories)
                         st.success("Deleted.")
                         st.rerun()
 
@@ -539,9 +648,8 @@ with TAB[0]:
         if not sel_make_key:
             st.info("Add or select a make to manage its models.")
         else:
-            st.markdown(f"**Models for {makes[sel_make_key]['label']}**")
-            models: Dict[str, Any] = makes[sel_make_key].setdefault(
-                "models", {})
+            st.markdown(f"**Models for {make_obj['label']}**")
+            models: Dict[str, Any] = make_obj.setdefault("models", {})
 
             with st.form("add_model_form"):
                 mdl_name = st.text_input("Model name")
@@ -585,28 +693,22 @@ with TAB[0]:
                                 "height": fmt_length(h_mm, h_in),
                             },
                         }
-                        catalog = rebuild_derived_catalog_structures(
-                            catalog, categories)
-                        _write_json(CATALOG_FP, catalog)
-                        bump_data_version()
+                        catalog = save_catalog(catalog, categories)
                         st.success(f"Added model: {mdl_name}")
                         st.rerun()
 
             if models:
-                # Table editor view
-                rows = []
-                for mk, mv in models.items():
-                    dims = mv.get("dimensions", {})
-                    rows.append({
-                        "key": mk,
-                        "Model": mv.get("label", mk),
-                        "Category": mv.get("category", ""),
-                        "Weight": dims.get("weight", ""),
-                        "Width": dims.get("width", ""),
-                        "Depth": dims.get("depth", ""),
-                        "Height": dims.get("height", ""),
-                    })
-                df = pd.DataFrame(rows)
+                # Table editor view (built column-wise)
+                dims_list = [mv.get("dimensions", {}) for mv in models.values()]
+                df = pd.DataFrame({
+                    "key": list(models.keys()),
+                    "Model": [mv.get("label", mk) for mk, mv in models.items()],
+                    "Category": [mv.get("category", "") for mv in models.values()],
+                    "Weight": [d.get("weight", "") for d in dims_list],
+                    "Width": [d.get("width", "") for d in dims_list],
+                    "Depth": [d.get("depth", "") for d in dims_list],
+                    "Height": [d.get("height", "") for d in dims_list],
+                })
                 edited = st.data_editor(
                     df,
                     num_rows="dynamic",
@@ -622,7 +724,7 @@ with TAB[0]:
                     if wide_button("💾 Save Changes", type="primary"):
                         # write back
                         new_models: Dict[str, Any] = {}
-                        for _, r in edited.iterrows():
+                        for r in edited.to_dict("records"):
                             key = str(r["key"]).strip()
                             label = str(r["Model"]).strip()
                             cat = str(r["Category"]).strip()
@@ -637,17 +739,13 @@ with TAB[0]:
                                     f"model-{time.time_ns()}")
                             new_models[key] = {
                                 "label": label, "category": cat, "dimensions": dims}
-                        makes[sel_make_key]["models"] = new_models
-                        catalog = rebuild_derived_catalog_structures(
-                            catalog, categories)
-                        _write_json(CATALOG_FP, catalog)
-                        bump_data_version()
+                        make_obj["models"] = new_models
+                        catalog = save_catalog(catalog, categories)
                         st.success("Catalog saved.")
                 with c2:
                     if wide_button("🧪 Validate"):
                         # Validate unique model names and categories exist
-                        keys = [k for k in edited["key"]]
-                        ok, dup = ensure_unique([str(k) for k in keys])
+                        ok, dup = ensure_unique_series(edited["key"])
                         if not ok:
                             st.error(f"Duplicate model key found: {dup}")
                         else:
@@ -666,10 +764,7 @@ with TAB[0]:
                         for k in list(models.keys()):
                             if k not in current_keys:
                                 del models[k]
-                        catalog = rebuild_derived_catalog_structures(
-                            catalog, categories)
-                        _write_json(CATALOG_FP, catalog)
-                        bump_data_version()
+                        catalog = save_catalog(catalog, categories)
                         st.success("Deleted removed rows.")
                         st.rerun()
 
@@ -696,17 +791,17 @@ with TAB[1]:
             else:
                 categories[key] = {"label": label or key, "sections": [
                     s.strip() for s in sections_txt.split(",") if s.strip()]}
-                _write_json(CATEGORIES_FP, categories)
-                bump_data_version()
+                if _write_json(CATEGORIES_FP, categories):
+                    bump_data_version()
                 st.success("Category added.")
                 st.rerun()
 
     # Editable table
-    rows = []
-    for k, v in categories.items():
-        rows.append({"key": k, "Label": v.get("label", k),
-                    "Sections (comma)": ", ".join(v.get("sections", []))})
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame({
+        "key": list(categories.keys()),
+        "Label": [v.get("label", k) for k, v in categories.items()],
+        "Sections (comma)": [", ".join(v.get("sections", [])) for v in categories.values()],
+    })
     edited = st.data_editor(df, **editor_width_kwargs(width='stretch'),
                             hide_index=True, num_rows="dynamic")
 
@@ -714,20 +809,19 @@ with TAB[1]:
     with c1:
         if wide_button("💾 Save Categories", type="primary"):
             new = {}
-            for _, r in edited.iterrows():
+            for r in edited.to_dict("records"):
                 k = str(r["key"]).strip() or slugify(
                     r.get("Label", f"cat-{time.time_ns()}"))
                 new[k] = {
                     "label": str(r.get("Label", k)).strip(),
                     "sections": [s.strip() for s in str(r.get("Sections (comma)", "")).split(",") if s.strip()],
                 }
-            _write_json(CATEGORIES_FP, new)
-            bump_data_version()
+            if _write_json(CATEGORIES_FP, new):
+                bump_data_version()
             st.success("Categories saved.")
     with c2:
         if wide_button("🧪 Validate cats"):
-            ok, dup = ensure_unique([str(r["key"])
-                                    for _, r in edited.iterrows()])
+            ok, dup = ensure_unique_series(edited["key"])
             if not ok:
                 st.error(f"Duplicate key: {dup}")
             else:
@@ -791,23 +885,20 @@ with TAB[2]:
                     except Exception as e:
                         st.error(f"Invalid JSON for visible_if: {e}")
                 q_list.append(new_q)
-                _write_json(QUESTIONS_FP, questions)
-                bump_data_version()
+                if _write_json(QUESTIONS_FP, questions):
+                    bump_data_version()
                 st.success("Field added.")
 
         # Editor
         if q_list:
-            q_rows = []
-            for it in q_list:
-                q_rows.append({
-                    "key": it.get("key", ""),
-                    "Label": it.get("label", ""),
-                    "Type": it.get("type", "text"),
-                    "Required": bool(it.get("required", False)),
-                    "Options (comma)": ", ".join(it.get("options", [])) if isinstance(it.get("options"), list) else "",
-                    "visible_if (JSON)": json.dumps(it.get("visible_if")) if isinstance(it.get("visible_if"), dict) else "",
-                })
-            df = pd.DataFrame(q_rows)
+            df = pd.DataFrame({
+                "key": [it.get("key", "") for it in q_list],
+                "Label": [it.get("label", "") for it in q_list],
+                "Type": [it.get("type", "text") for it in q_list],
+                "Required": [bool(it.get("required", False)) for it in q_list],
+                "Options (comma)": [", ".join(it["options"]) if isinstance(it.get("options"), list) else "" for it in q_list],
+                "visible_if (JSON)": [json.dumps(it["visible_if"]) if isinstance(it.get("visible_if"), dict) else "" for it in q_list],
+            })
             edited = st.data_editor(
                 df,
                 **editor_width_kwargs(width='stretch'),
@@ -823,7 +914,7 @@ with TAB[2]:
                 if wide_button("💾 Save Questions", type="primary"):
                     new_list = []
                     keys_seen = set()
-                    for _, r in edited.iterrows():
+                    for r in edited.to_dict("records"):
                         k = str(r["key"]).strip() or slugify(
                             r.get("Label", "field"))
                         if k in keys_seen:
@@ -850,8 +941,8 @@ with TAB[2]:
                                 st.stop()
                         new_list.append(item)
                     questions.setdefault(cat_sel, {})[sec_sel] = new_list
-                    _write_json(QUESTIONS_FP, questions)
-                    bump_data_version()
+                    if _write_json(QUESTIONS_FP, questions):
+                        bump_data_version()
                     st.success("Saved.")
             with c2:
                 if wide_button("🧪 Validate Section"):
@@ -891,10 +982,9 @@ with TAB[3]:
                 fname = slugify(os.path.splitext(f.name)[
                                 0]) + os.path.splitext(f.name)[1].lower()
                 out = os.path.join(MEDIA_DIR, fname)
-                with open(out, "wb") as w:
-                    w.write(f.read())
-                media_index.setdefault("images", {})[fname] = {
-                    "path": out, "ts": time.time()}
+                images_idx = media_index.setdefault("images", {})
+                if _save_upload(f, out) or fname not in images_idx:
+                    images_idx[fname] = {"path": out, "ts": time.time()}
                 # Quick-attach: add to gallery and set hero if not set
                 if media_obj is not None:
                     if fname not in media_obj.get("gallery", []):
@@ -906,13 +996,11 @@ with TAB[3]:
                 count += 1
 
             _write_json(MEDIA_INDEX_FP, media_index)
+            flush_writes()
 
             # Persist catalog if we attached anything
             if media_obj is not None and (attached > 0 or hero_set):
-                catalog = rebuild_derived_catalog_structures(
-                    catalog, categories)
-                _write_json(CATALOG_FP, catalog)
-                bump_data_version()
+                catalog = save_catalog(catalog, categories)
                 make_label = catalog.get("makes", {}).get(
                     sel_make, {}).get("label", sel_make)
                 model_label = catalog.get("makes", {}).get(sel_make, {}).get(
@@ -941,22 +1029,19 @@ with TAB[3]:
                 fname = slugify(os.path.splitext(f.name)[
                                 0]) + os.path.splitext(f.name)[1].lower()
                 out = os.path.join(MEDIA_DIR, fname)
-                with open(out, "wb") as w:
-                    w.write(f.read())
-                media_index.setdefault("brochures", {})[fname] = {
-                    "path": out, "ts": time.time()}
+                brochures_idx = media_index.setdefault("brochures", {})
+                if _save_upload(f, out) or fname not in brochures_idx:
+                    brochures_idx[fname] = {"path": out, "ts": time.time()}
                 if media_obj is not None and fname not in media_obj.get("brochures", []):
                     media_obj["brochures"].append(fname)
                     attached += 1
                 count += 1
 
             _write_json(MEDIA_INDEX_FP, media_index)
+            flush_writes()
 
             if media_obj is not None and attached > 0:
-                catalog = rebuild_derived_catalog_structures(
-                    catalog, categories)
-                _write_json(CATALOG_FP, catalog)
-                bump_data_version()
+                catalog = save_catalog(catalog, categories)
                 make_label = catalog.get("makes", {}).get(
                     sel_make, {}).get("label", sel_make)
                 model_label = catalog.get("makes", {}).get(sel_make, {}).get(
@@ -1047,7 +1132,10 @@ with TAB[3]:
                 st.caption("Hero preview:")
                 img_path = resolve_image_path(hero)
                 if img_path:
-                    st.image(img_path, width=250)
+                    try:
+                        st.image(preview_image(img_path, _mtime(img_path)), width=PREVIEW_W)
+                    except Exception:
+                        st.warning(f"Error reading: {hero}")
                 else:
                     st.warning(f"Hero image not found on disk: {hero}")
 
@@ -1059,11 +1147,11 @@ with TAB[3]:
                 for i, fname in enumerate(gallery):
                     fpath = resolve_image_path(fname)
                     with cols[i % len(cols)]:
-                        if fpath and os.path.exists(fpath):
+                        if fpath:  # resolve_image_path only returns existing files
                             try:
                                 with open(fpath, "rb") as f:
                                     img_bytes = f.read()
-                                st.image(img_bytes, caption=fname, width=250)
+                                st.image(preview_image(fpath, _mtime(fpath)), caption=fname, width=PREVIEW_W)
                                 st.download_button(
                                     "Download",
                                     data=img_bytes,
@@ -1081,20 +1169,20 @@ with TAB[3]:
                 st.caption("Brochures:")
                 for fname in brochures:
                     fpath = os.path.join(MEDIA_DIR, fname)
+                    # The download payload has to be read anyway; its length is the size
                     try:
-                        size_kb = os.path.getsize(fpath) // 1024
+                        with open(fpath, "rb") as f:
+                            pdf_bytes = f.read()
                     except Exception:
-                        size_kb = None
+                        pdf_bytes = None
 
                     left, right = st.columns([3, 1])
                     with left:
                         meta = f"📄 {fname}" + \
-                            (f"  ({size_kb} KB)" if size_kb is not None else "")
+                            (f"  ({len(pdf_bytes) // 1024} KB)" if pdf_bytes is not None else "")
                         st.write(meta)
                     with right:
-                        try:
-                            with open(fpath, "rb") as f:
-                                pdf_bytes = f.read()
+                        if pdf_bytes is not None:
                             st.download_button(
                                 "Download PDF",
                                 data=pdf_bytes,
@@ -1102,7 +1190,7 @@ with TAB[3]:
                                 mime="application/pdf",
                                 key=f"dl_pdf_{fname}",
                             )
-                        except Exception:
+                        else:
                             st.warning("Not found")
 
             if wide_button("💾 Save Media Attachments", type="primary"):
@@ -1111,8 +1199,8 @@ with TAB[3]:
                 media_obj["brochures"] = brochures
 
                 # persist changes
-                _write_json(CATALOG_FP, catalog)
-                bump_data_version()
+                if _write_json(CATALOG_FP, catalog):
+                    bump_data_version()
                 st.success("Media saved.")
 
 # -----------------------------
@@ -1179,7 +1267,7 @@ with TAB[4]:
         # Try to display raw
         if uploaded.type.endswith("json"):
             raw = json.load(uploaded)
-            st.code(json.dumps(raw, indent=2)[:2000])
+            st.code(_json_preview(raw))
         else:
             df = pd.read_csv(uploaded)
             st.dataframe(df, **editor_width_kwargs(width='stretch'))
@@ -1216,17 +1304,19 @@ with TAB[4]:
             try:
                 if uploaded.type.endswith("json"):
                     data = raw if isinstance(raw, list) else raw.get("items", [])
-                    df = pd.DataFrame(data)
+                    # JSON items are already row dicts; skip the DataFrame round trip
+                    records = [r for r in data if isinstance(r, dict)]
                 else:
                     uploaded.seek(0)
-                    df = pd.read_csv(uploaded)
+                    records = pd.read_csv(uploaded).to_dict("records")
             except Exception as e:
                 st.error(f"Failed to read file: {e}")
                 st.stop()
 
             # Normalize each row
             imp_count = 0
-            for _, r in df.iterrows():
+            makes = catalog.setdefault("makes", {})
+            for r in records:
                 make = str(r.get(f_make, "")).strip()
                 model = str(r.get(f_model, "")).strip()
                 cat = str(r.get(f_cat, "")).strip() or "smart_safe"
@@ -1234,7 +1324,6 @@ with TAB[4]:
                     continue
                 mk = slugify(make)
                 mdlk = slugify(model)
-                makes = catalog.setdefault("makes", {})
                 m_entry = makes.setdefault(mk, {"label": make, "models": {}})
                 mm = m_entry.setdefault("models", {})
                 target = mm.get(mdlk)
@@ -1256,9 +1345,7 @@ with TAB[4]:
                 }
                 imp_count += 1
 
-            catalog = rebuild_derived_catalog_structures(catalog, categories)
-            _write_json(CATALOG_FP, catalog)
-            bump_data_version()
+            catalog = save_catalog(catalog, categories)
             st.success(f"Imported {imp_count} rows.")
 
 
@@ -1331,8 +1418,8 @@ with TAB[5]:
 
     # --- Save Settings ONCE and rerun ---
     if submitted:
-        _write_json(SETTINGS_FP, s)
-        bump_data_version()
+        if _write_json(SETTINGS_FP, s):
+            bump_data_version()
         st.success("Settings saved!")
         st.rerun()
 
@@ -1341,7 +1428,10 @@ with TAB[5]:
         st.markdown("### Hero Image Preview")
         img_path = os.path.join(MEDIA_DIR, s["media"]["hero_image"])
         if os.path.exists(img_path):
-            st.image(img_path, width=250)
+            try:
+                st.image(preview_image(img_path, _mtime(img_path)), width=PREVIEW_W)
+            except Exception:
+                st.warning(f"Error reading: {img_path}")
         else:
             st.error(f"Image not found: {img_path}")
 
@@ -1411,6 +1501,14 @@ with TAB[6]:
             st.success("Cleared Streamlit data caches.")
     st.caption("Tip: Commit the ./data folder to version control to track admin edits.")
 
+    # Photo resize/encode for the PDF is Pillow-bound; show which build is active
+    with st.expander("Image backend", expanded=False):
+        turbo = pil_features.check_feature("libjpeg_turbo")
+        st.write(f"Pillow {PIL.__version__}" + (" (Pillow-SIMD)" if ".post" in PIL.__version__ else ""))
+        st.write(f"libjpeg-turbo: {'yes' if turbo else 'no'}")
+        if not turbo:
+            st.caption("JPEG decode/encode is faster with a libjpeg-turbo build; see readme (Local Setup).")
+
     st.divider()
     st.markdown("### Export / Backup data folder")
 
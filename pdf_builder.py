@@ -1,14 +1,36 @@
 import datetime
+import functools
+import gc
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
-from PIL import Image
+from PIL import Image, ImageFile, ImageOps
 from fpdf import FPDF
+from fpdf.drawing import DeviceGray, DeviceRGB
 from fpdf.enums import XPos, YPos
 
 from visible_if import is_visible as visible_if_field, evaluate as visible_if_eval
 
+# Refuse to decode absurdly large uploads (PIL raises DecompressionBombError)
+Image.MAX_IMAGE_PIXELS = 50_000_000
+# Phone uploads are sometimes cut short; render what decoded instead of failing
+ImageFile.LOAD_TRUNCATED_IMAGES = True
+
+
+# Typographic punctuation -> core-font friendly ASCII, applied in one pass
+_SANITIZE_TABLE = str.maketrans({
+    "–": "-",
+    "—": "-",
+    "“": "\"",
+    "”": "\"",
+    "’": "'",
+    # Arrows have no latin-1 glyph; spell them out instead of dropping them
+    "↓": "Down",
+    "↑": "Up",
+})
+
 
 def sanitize(text: Any) -> str:
     """
@@ -17,15 +39,16 @@ def sanitize(text: Any) -> str:
     """
     if not isinstance(text, str):
         text = "" if text is None else str(text)
-    return (
-        text.replace("–", "-")
-        .replace("—", "-")
-        .replace("“", "\"")
-        .replace("”", "\"")
-        .replace("’", "'")
-        .encode("latin-1", errors="ignore")
-        .decode("latin-1")
-    )
+    if text.isascii():
+        return text
+    return _sanitize_non_ascii(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_non_ascii(text: str) -> str:
+    # Labels and option values repeat across rows and reports; ASCII text
+    # never reaches here, so the cache only holds strings that need work.
+    return text.translate(_SANITIZE_TABLE).encode("latin-1", errors="ignore").decode("latin-1")
 
 
 def normalize_model_for_filename(text: str) -> str:
@@ -73,7 +96,7 @@ def truncate_for_filename(text: str, max_len: int = 40) -> str:
     return cut + "..."
 
 
-def get_store_name(state: Dict[str, Any]) -> str:
+def get_store_name(state: Mapping[str, Any]) -> str:
     """
     Prefer the explicit store_name field (it's required in questions.json).
     Keep a tiny fallback just in case the schema changes later.
@@ -119,6 +142,12 @@ def nbsp_units(s: str) -> str:
     return txt
 
 
+@functools.lru_cache(maxsize=256)
+def equipment_dims_text(width: str, depth: str, height: str) -> str:
+    """'W x D x H' with units kept on their numbers; the catalog is static, so memoized per model."""
+    return nbsp_units(f"{width} x {depth} x {height}")
+
+
 # ---------------- PDF Layout Constants ----------------
 
 GRAY = (230, 230, 230)
@@ -134,38 +163,54 @@ SPACE_AFTER_BLOCK = 1.2
 # Horizontal rule defaults (used by draw_hr and spacing checks)
 HR_THICK = 0.4
 HR_PAD = 2
+# Photo re-encoding: downscale to the drawn size at this DPI, collect garbage every N photos
+PHOTO_DPI = 200
+PHOTO_JPEG_QUALITY = 82
+PHOTO_GC_EVERY = 5
+# Photos are decoded/re-encoded on up to this many threads (Pillow releases
+# the GIL); also capped by CPU count, since each worker holds a full decode
+PHOTO_WORKERS = 4
+EXIF_ORIENTATION = 0x0112
+# Rows with label/value shorter than these skip multi_cell measurement
+FAST_ROW_LABEL_CHARS = 40
+FAST_ROW_VALUE_CHARS = 80
+# Hours table column widths: Day / Open / Close
+HOURS_COL_WIDTHS = (40, 35, 35)
+# Footer never changes, so it is sanitized once at import
+FOOTER_TEXT = sanitize("Generated by Site Survey App - Version 1.0 - © 2025")
+
+
+@functools.lru_cache(maxsize=None)
+def _device_color(rgb: Tuple[int, int, int]) -> Union[DeviceGray, DeviceRGB]:
+    """The palette is a handful of constants, so convert each one once (black maps to gray like FPDF does)."""
+    r, g, b = rgb
+    if rgb == (0, 0, 0):
+        return DeviceGray(0)
+    return DeviceRGB(r / 255, g / 255, b / 255)
 
 
 def set_text_color(pdf: FPDF, rgb: Tuple[int, int, int]) -> None:
-    r, g, b = rgb
-    pdf.set_text_color(r, g, b)
+    pdf.set_text_color(_device_color(rgb))
 
 
 def set_fill_color(pdf: FPDF, rgb: Tuple[int, int, int]) -> None:
-    r, g, b = rgb
-    pdf.set_fill_color(r, g, b)
+    pdf.set_fill_color(_device_color(rgb))
 
 
 def usable_width(pdf: FPDF) -> float:
     return pdf.w - pdf.l_margin - pdf.r_margin
 
 
-def remaining_height(pdf: FPDF) -> float:
-    return (pdf.h - pdf.b_margin) - pdf.get_y()
-
-
-def ensure_space_for(pdf: FPDF, height_needed: float) -> None:
-    if remaining_height(pdf) < height_needed:
-        pdf.add_page()
-
-
-def ensure_space(pdf: FPDF, needed: float) -> None:
-    if remaining_height(pdf) < needed:
-        pdf.add_page()
-
-
-def ensure_glue(pdf: FPDF, min_after: float = 22) -> None:
-    if remaining_height(pdf) < min_after:
+def ensure_space_for(
+    pdf: FPDF, height_needed: float, pdf_bottom: Optional[float] = None
+) -> None:
+    """
+    Page-break unless height_needed fits above the bottom margin. Callers that
+    check repeatedly can pass a precomputed pdf_bottom (pdf.h - pdf.b_margin).
+    """
+    if pdf_bottom is None:
+        pdf_bottom = pdf.h - pdf.b_margin
+    if pdf.get_y() + height_needed > pdf_bottom:
         pdf.add_page()
 
 
@@ -257,7 +302,7 @@ def page_title(pdf: FPDF, title: str, date_str: str, logo_path: Optional[str] =
 
 
 def section_header(pdf: FPDF, text: str) -> None:
-    ensure_glue(pdf, min_after=24)
+    ensure_space_for(pdf, 24)
     set_fill_color(pdf, GRAY)
     set_text_color(pdf, DARK)
     pdf.set_font("Helvetica", "B", 12.5)
@@ -273,8 +318,14 @@ def section_header(pdf: FPDF, text: str) -> None:
     pdf.ln(SPACE_AFTER_SEC)
 
 
-def para(pdf: FPDF, label: str, text: Any, line_h: float = H_ROW) -> None:
-    ensure_space_for(pdf, line_h * 2)
+def para(
+    pdf: FPDF,
+    label: str,
+    text: Any,
+    line_h: float = H_ROW,
+    pdf_bottom: Optional[float] = None,
+) -> None:
+    ensure_space_for(pdf, line_h * 2, pdf_bottom)
     pdf.set_font("Helvetica", "B", 11)
     set_text_color(pdf, DARK)
     pdf.cell(
@@ -290,32 +341,34 @@ def para(pdf: FPDF, label: str, text: Any, line_h: float = H_ROW) -> None:
     pdf.multi_cell(
         usable_width(pdf),
         line_h,
-        text=sanitize("" if text is None else str(text)),
+        text=sanitize(text),
         new_x=XPos.LMARGIN,
         new_y=YPos.NEXT,
         align="L",
     )
 
 
-def hours_table(pdf: FPDF, hours_dict: Dict[str, Any]) -> None:
-    def _header() -> Tuple[float, float, float]:
-        set_fill_color(pdf, GRAY)
-        set_text_color(pdf, DARK)
-        pdf.set_font("Helvetica", "B", 11)
-        day_w, open_w, close_w = 40, 35, 35
-        pdf.cell(day_w, H_TABLE, text="Day")
-        pdf.cell(open_w, H_TABLE, text="Open")
-        pdf.cell(
-            close_w,
-            H_TABLE,
-            text="Close",
-            new_x=XPos.LMARGIN,
-            new_y=YPos.NEXT,
-        )
-        return day_w, open_w, close_w
+def _hours_header(pdf: FPDF) -> None:
+    day_w, open_w, close_w = HOURS_COL_WIDTHS
+    set_fill_color(pdf, GRAY)
+    set_text_color(pdf, DARK)
+    pdf.set_font("Helvetica", "B", 11)
+    pdf.cell(day_w, H_TABLE, text="Day")
+    pdf.cell(open_w, H_TABLE, text="Open")
+    pdf.cell(
+        close_w,
+        H_TABLE,
+        text="Close",
+        new_x=XPos.LMARGIN,
+        new_y=YPos.NEXT,
+    )
 
-    ensure_space_for(pdf, H_TABLE * 2)
-    day_w, open_w, close_w = _header()
+
+def hours_table(pdf: FPDF, hours_dict: Dict[str, Any]) -> None:
+    day_w, open_w, close_w = HOURS_COL_WIDTHS
+    pdf_bottom = pdf.h - pdf.b_margin
+    ensure_space_for(pdf, H_TABLE * 2, pdf_bottom)
+    _hours_header(pdf)
 
     pdf.set_font("Helvetica", "", 11)
     set_text_color(pdf, (0, 0, 0))
@@ -334,42 +387,66 @@ def hours_table(pdf: FPDF, hours_dict: Dict[str, Any]) -> None:
                 open_t, close_t = None, None
             closed = not (open_t or close_t)
 
-        if remaining_height(pdf) < (H_TABLE + 2):
+        if pdf.get_y() + H_TABLE + 2 > pdf_bottom:
             pdf.add_page()
-            day_w, open_w, close_w = _header()
+            _hours_header(pdf)
+            # The header switches to bold/dark; restore the body style once
+            pdf.set_font("Helvetica", "", 11)
+            set_text_color(pdf, (0, 0, 0))
 
+        # Times are formatted here; only the em-dash placeholder needs sanitizing
         if closed:
-            o = "Closed"
-            c = "Closed"
+            o = c = "Closed"
         else:
-            o = fmt_time_or_dash(open_t)
-            c = fmt_time_or_dash(close_t)
+            o = sanitize(fmt_time_or_dash(open_t))
+            c = sanitize(fmt_time_or_dash(close_t))
 
         pdf.cell(day_w, H_TABLE, text=sanitize(day))
-        pdf.cell(open_w, H_TABLE, text=sanitize(o))
+        pdf.cell(open_w, H_TABLE, text=o)
         pdf.cell(
             close_w,
             H_TABLE,
-            text=sanitize(c),
+            text=c,
             new_x=XPos.LMARGIN,
             new_y=YPos.NEXT,
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _image_size(path: str, mtime_ns: int) -> Tuple[int, int]:
+    """Pixel size from the image header; memoized per file version across builds."""
+    with Image.open(path) as img:
+        return img.size
+
+
 def center_image(
     pdf: FPDF,
-    path: str,
+    path: Union[str, BytesIO],
     max_w: Optional[float] = None,
     max_h: Optional[float] = None,
     y_top: Optional[float] = None,
+    size: Optional[Tuple[int, int]] = None,
 ) -> Tuple[float, float]:
-    if not os.path.exists(path):
-        return (0, 0)
-    with Image.open(path) as img:
-        w_img, h_img = img.size
+    """
+    Draw an image horizontally centered. `path` may be a file path or an
+    in-memory buffer; pass `size` (pixels) when it is already known, otherwise
+    it is read from the file (memoized) or the buffer's header.
+    """
+    if size is None:
+        if isinstance(path, str):
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return (0, 0)
+            size = _image_size(path, mtime)
+        else:
+            with Image.open(path) as img:
+                size = img.size
+            path.seek(0)
+    w_img, h_img = size
 
     page_w, page_h = pdf.w, pdf.h
-    usable_w = page_w - pdf.l_margin - pdf.r_margin
+    usable_w = usable_width(pdf)
 
     if max_w is None:
         max_w = usable_w
@@ -391,6 +468,47 @@ def center_image(
     return (draw_w, draw_h)
 
 
+def _encode_photo(photo: Any, target: Tuple[int, int]) -> Tuple[BytesIO, Tuple[int, int]]:
+    """
+    Decode an uploaded photo, fit it inside `target` pixels and re-encode it
+    as JPEG in memory. Safe to run on worker threads; touches no FPDF state.
+    """
+    with Image.open(photo) as img:
+        # Already an upright RGB JPEG that fits: embed the upload as-is
+        if (
+            img.format == "JPEG"
+            and img.mode == "RGB"
+            and img.width <= target[0]
+            and img.height <= target[1]
+            and img.getexif().get(EXIF_ORIENTATION, 1) == 1
+        ):
+            return BytesIO(photo.getvalue()), img.size
+        # Let libjpeg's DCT scaler decode at 1/2..1/8 size; other
+        # formats decode fully and rely on the thumbnail below
+        if img.format == "JPEG":
+            img.draft("RGB", target)
+        rgb = img.convert("RGB")
+    # Re-encode in memory; fpdf2 embeds straight from the buffer
+    buf = BytesIO()
+    try:
+        # Phone photos carry rotation in EXIF; bake it in before resizing
+        ImageOps.exif_transpose(rgb, in_place=True)
+        rgb.thumbnail(target, Image.Resampling.LANCZOS)
+        rgb.save(
+            buf,
+            format="JPEG",
+            quality=PHOTO_JPEG_QUALITY,
+            optimize=True,
+            progressive=True,
+        )
+        size = rgb.size
+    finally:
+        rgb.close()
+        del rgb
+    buf.seek(0)
+    return buf, size
+
+
 # ---------- Two-cell Q/A helpers ----------
 
 
@@ -399,6 +517,21 @@ def _label_with_punct(s: str) -> str:
     return s if s.endswith((":", "?")) else s + ":"
 
 
+def _fits_one_line(pdf: FPDF, w: float, text: str) -> bool:
+    """True if text fits within a cell of width w using the current font."""
+    return pdf.get_string_width(text) <= w - 2 * pdf.c_margin
+
+
+def _wrap_lines(pdf: FPDF, w: float, h: float, text: str, max_chars: int) -> List[str]:
+    """
+    Lines multi_cell would produce for text. Short single-line text that fits
+    the width is returned as-is, skipping the dry-run measurement.
+    """
+    if len(text) < max_chars and "\n" not in text and _fits_one_line(pdf, w, text):
+        return [text]
+    return _measure_lines(pdf, w, h, text) or [""]
+
+
 def kv_row_fixed_two_cells(
     pdf: FPDF,
     label: str,
@@ -413,7 +546,7 @@ def kv_row_fixed_two_cells(
     val_w = max(0, total_w - label_w - gap)
 
     label_text = sanitize(_label_with_punct(label))
-    value_text = sanitize("" if value is None else str(value))
+    value_text = sanitize(value)
 
     # Measure with the SAME fonts you will draw with
     pdf.set_font("Helvetica", "B", 11)
@@ -461,109 +594,88 @@ def kv_row_fixed_two_cells(
     pdf.set_xy(x0, y0 + row_h)
 
 
-def kv_row_two_col(
+def _value_text(value: Any) -> str:
+    """Format an answer for a value cell; sequences become comma-separated."""
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(sanitize(str(v)) for v in value)
+    return sanitize(value)
+
+
+def kv_rows_two_col(
     pdf: FPDF,
-    label: str,
-    value: Any,
+    rows: List[Tuple[str, Any]],
     col_w_label: float,
     col_w_value: float,
     line_h: float = 5,
     gutter: float = 4,
 ) -> None:
-    # Save original position
-    x0, y0 = pdf.get_x(), pdf.get_y()
-
-    # --- Use identical fonts for measure + draw ---
-    label_txt = sanitize("" if label is None else str(label))
-
-    # Format values nicely:
-    if isinstance(value, (list, tuple, set)):
-        value_txt = ", ".join(sanitize(str(v)) for v in value)
-    else:
-        value_txt = sanitize("" if value is None else str(value))
-
-
-    # Measure with the SAME fonts you will draw with
-    pdf.set_font("Helvetica", "B", 10)
-    try:
-        label_lines = pdf.multi_cell(
-            col_w_label, line_h, label_txt, dry_run=True, output="LINES"
-        )
-    except TypeError:
-        label_lines = pdf.multi_cell(
-            col_w_label, line_h, label_txt, split_only=True
-        )
-
-    pdf.set_font("Helvetica", "", 10)
-    try:
-        value_lines = pdf.multi_cell(
-            col_w_value, line_h, value_txt, dry_run=True, output="LINES"
-        )
-    except TypeError:
-        value_lines = pdf.multi_cell(
-            col_w_value, line_h, value_txt, split_only=True
-        )
+    """
+    Render a run of label/value rows (bold label column, regular value column)
+    with one multi_cell per column per page: every row is wrapped up front,
+    padded to its row height with blank lines, and each page's labels and
+    values are emitted as single text blocks. A row taller than a page is
+    drawn on its own, with its value flowing across page breaks.
+    """
+    if not rows:
+        return
 
-    row_h = max(len(label_lines) or 1, len(value_lines) or 1) * line_h
+    texts = [(sanitize(lbl), _value_text(val)) for lbl, val in rows]
 
-    # Page-break BEFORE drawing if needed
-    if y0 + row_h > pdf.h - pdf.b_margin:
-        pdf.add_page()
-        x0, y0 = pdf.get_x(), pdf.get_y()
-
-    # Draw label
-    pdf.set_xy(x0, y0)
     pdf.set_font("Helvetica", "B", 10)
-    pdf.multi_cell(col_w_label, line_h, label_txt, align="L")
-
-    # Draw value
-    pdf.set_xy(x0 + col_w_label + gutter, y0)
+    label_lines = [
+        _wrap_lines(pdf, col_w_label, line_h, lt, FAST_ROW_LABEL_CHARS) for lt, _ in texts
+    ]
     pdf.set_font("Helvetica", "", 10)
-    pdf.multi_cell(col_w_value, line_h, value_txt, align="L")
-
-    # Advance the cursor exactly one row
-    pdf.set_xy(x0, y0 + row_h)
-
-
-def _pair_block(
-    pdf: FPDF,
-    x: float,
-    y: float,
-    col_w: float,
-    label: str,
-    value: Any,
-    label_w: float,
-    line_h: float = H_ROW,
-    gap: float = 4,
-) -> float:
-    """Draw one label/value pair inside a column at (x,y) and return end y."""
-    pdf.set_xy(x, y)
-    pdf.set_font("Helvetica", "B", 11)
-    set_text_color(pdf, DARK)
-    pdf.multi_cell(
-        label_w,
-        line_h,
-        text=sanitize(f"{label.rstrip(':')}:"),
-        new_x=XPos.LEFT,
-        new_y=YPos.NEXT,
-        align="L",
-    )
-    y_label_end = pdf.get_y()
-
-    pdf.set_xy(x + label_w + gap, y)
-    pdf.set_font("Helvetica", "", 11)
-    set_text_color(pdf, (0, 0, 0))
-    pdf.multi_cell(
-        col_w - label_w - gap,
-        line_h,
-        text=sanitize("" if value is None else str(value)),
-        new_x=XPos.LEFT,
-        new_y=YPos.NEXT,
-        align="L",
-    )
-    y_value_end = pdf.get_y()
+    value_lines = [
+        _wrap_lines(pdf, col_w_value, line_h, vt, FAST_ROW_VALUE_CHARS) for _, vt in texts
+    ]
+
+    def _draw_page(labels: List[str], values: List[str], x: float, y: float) -> None:
+        if not labels:
+            return
+        pdf.set_font("Helvetica", "B", 10)
+        pdf.set_xy(x, y)
+        pdf.multi_cell(col_w_label, line_h, "\n".join(labels), align="L")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_xy(x + col_w_label + gutter, y)
+        pdf.multi_cell(col_w_value, line_h, "\n".join(values), align="L")
+
+    x0, y = pdf.get_x(), pdf.get_y()
+    page_y = y
+    bottom = pdf.h - pdf.b_margin
+    labels: List[str] = []
+    values: List[str] = []
+    for (label_txt, value_txt), l_lines, v_lines in zip(texts, label_lines, value_lines):
+        n = max(len(l_lines), len(v_lines))
+        row_h = n * line_h
+        # Page-break BEFORE drawing if needed
+        if y + row_h > bottom:
+            _draw_page(labels, values, x0, page_y)
+            labels, values = [], []
+            pdf.add_page()
+            x0, y = pdf.get_x(), pdf.get_y()
+            page_y = y
+        # A row taller than a whole page can't be padded into the page block:
+        # draw it on its own so the value flows onto the following pages
+        if row_h > bottom - page_y:
+            pdf.set_font("Helvetica", "B", 10)
+            pdf.set_xy(x0, y)
+            pdf.multi_cell(col_w_label, line_h, label_txt, align="L")
+            pdf.set_font("Helvetica", "", 10)
+            pdf.set_xy(x0 + col_w_label + gutter, y)
+            pdf.multi_cell(col_w_value, line_h, value_txt, align="L")
+            y += row_h
+            page_y = y
+            continue
+        labels.extend(l_lines)
+        labels.extend([""] * (n - len(l_lines)))
+        values.extend(v_lines)
+        values.extend([""] * (n - len(v_lines)))
+        y += row_h
+    _draw_page(labels, values, x0, page_y)
 
-    return max(y_label_end, y_value_end)
+    # Leave the cursor just below the last row
+    pdf.set_xy(x0, y)
 
 
 def kv_row_two_pairs_wrapped(
@@ -575,25 +687,50 @@ def kv_row_two_pairs_wrapped(
     label_w: float = 28,
     gap_between_cols: float = 10,
     inner_gap: float = 4,
+    line_h: float = H_ROW,
 ) -> None:
     """
     Render two label/value pairs on one line (left and right columns),
-    each pair wraps within its own half of the page.
+    each pair wraps within its own half of the page. Both labels are drawn
+    first, then both values, so each font/colour is set only once.
     """
     x_left = pdf.l_margin
     y_top = pdf.get_y()
     total_w = usable_width(pdf)
     col_w = (total_w - gap_between_cols) / 2.0
     x_right = x_left + col_w + gap_between_cols
+    val_w = col_w - label_w - inner_gap
+    y_end = y_top
 
-    y_end_left = _pair_block(
-        pdf, x_left, y_top, col_w, l1, v1, label_w, gap=inner_gap
-    )
-    y_end_right = _pair_block(
-        pdf, x_right, y_top, col_w, l2, v2, label_w, gap=inner_gap
-    )
+    pdf.set_font("Helvetica", "B", 11)
+    set_text_color(pdf, DARK)
+    for x, label in ((x_left, l1), (x_right, l2)):
+        pdf.set_xy(x, y_top)
+        pdf.multi_cell(
+            label_w,
+            line_h,
+            text=sanitize(f"{label.rstrip(':')}:"),
+            new_x=XPos.LEFT,
+            new_y=YPos.NEXT,
+            align="L",
+        )
+        y_end = max(y_end, pdf.get_y())
 
-    pdf.set_xy(pdf.l_margin, max(y_end_left, y_end_right))
+    pdf.set_font("Helvetica", "", 11)
+    set_text_color(pdf, (0, 0, 0))
+    for x, value in ((x_left, v1), (x_right, v2)):
+        pdf.set_xy(x + label_w + inner_gap, y_top)
+        pdf.multi_cell(
+            val_w,
+            line_h,
+            text=sanitize(value),
+            new_x=XPos.LEFT,
+            new_y=YPos.NEXT,
+            align="L",
+        )
+        y_end = max(y_end, pdf.get_y())
+
+    pdf.set_xy(pdf.l_margin, y_end)
 
 
 def field_visible(field: Dict[str, Any], answers: Dict[str, Any]) -> bool:
@@ -637,6 +774,8 @@ def write_section_to_pdf_QA(
     gutter = 4
     col_w_label = label_w
     col_w_value = max(0, total_w - col_w_label - gutter)
+    pdf_bottom = pdf.h - pdf.b_margin
+    rows: List[Tuple[str, Any]] = []
     for field in section.get("fields", []):
         # Use new DSL visibility if present, fallback to legacy
         vis = (
@@ -655,22 +794,18 @@ def write_section_to_pdf_QA(
 
         if ftype == "textarea" and force_full:
             if val not in (None, "", []):
-                para(pdf, label, val)
+                kv_rows_two_col(
+                    pdf, rows, col_w_label, col_w_value, line_h=H_ROW, gutter=gutter
+                )
+                rows = []
+                para(pdf, label, val, pdf_bottom=pdf_bottom)
         else:
-            kv_row_two_col(
-                pdf,
-                label,
-                val,
-                col_w_label,
-                col_w_value,
-                line_h=H_ROW,
-                gutter=gutter,
-            )
+            rows.append((label, val))
+    kv_rows_two_col(pdf, rows, col_w_label, col_w_value, line_h=H_ROW, gutter=gutter)
 
-    thickness = HR_THICK
-    need = SPACE_AFTER_BLOCK + HR_PAD + thickness + HR_PAD
-    if pdf.get_y() + need > (pdf.h - pdf.b_margin):
-        pdf.add_page()
+    ensure_space_for(
+        pdf, SPACE_AFTER_BLOCK + HR_PAD + HR_THICK + HR_PAD, pdf_bottom
+    )
 
     pdf.ln(SPACE_AFTER_BLOCK)
     draw_hr(pdf)
@@ -699,6 +834,7 @@ def write_site_info(
         gutter = 4
         col_w_label = 90
         col_w_value = max(0, total_w - col_w_label - gutter)
+        rows: List[Tuple[str, Any]] = []
 
         for field in sec.get("fields", []):
             vis = (
@@ -730,17 +866,14 @@ def write_site_info(
 
             if ftype == "textarea":
                 if val not in (None, "", []):
+                    kv_rows_two_col(
+                        pdf, rows, col_w_label, col_w_value, line_h=H_ROW, gutter=gutter
+                    )
+                    rows = []
                     para(pdf, label, val)
             else:
-                kv_row_two_col(
-                    pdf,
-                    label,
-                    val,
-                    col_w_label,
-                    col_w_value,
-                    line_h=H_ROW,
-                    gutter=gutter,
-                )
+                rows.append((label, val))
+        kv_rows_two_col(pdf, rows, col_w_label, col_w_value, line_h=H_ROW, gutter=gutter)
 
         pdf.ln(SPACE_AFTER_BLOCK)
         draw_hr(pdf)
@@ -763,6 +896,7 @@ def write_contact_info(
             gutter = 4
             col_w_label = 90
             col_w_value = max(0, total_w - col_w_label - gutter)
+            rows: List[Tuple[str, Any]] = []
             for field in sec.get("fields", []):
                 vis = (
                     visible_if_eval(
@@ -781,17 +915,16 @@ def write_contact_info(
                 val = answers.get(name)
                 if ftype == "textarea":
                     if val not in (None, "", []):
+                        kv_rows_two_col(
+                            pdf, rows, col_w_label, col_w_value, line_h=H_ROW, gutter=gutter
+                        )
+                        rows = []
                         para(pdf, label, val)
                 else:
-                    kv_row_two_col(
-                        pdf,
-                        label,
-                        val,
-                        col_w_label,
-                        col_w_value,
-                        line_h=H_ROW,
-                        gutter=gutter,
-                    )
+                    rows.append((label, val))
+            kv_rows_two_col(
+                pdf, rows, col_w_label, col_w_value, line_h=H_ROW, gutter=gutter
+            )
             pdf.ln(SPACE_AFTER_BLOCK)
             draw_hr(pdf)
             break
@@ -802,7 +935,7 @@ def build_survey_pdf(
     answers: Dict[str, Any],
     sections_used: List[Dict[str, Any]],
     hours: Dict[str, Any],
-    validate_state: Dict[str, Any],
+    validate_state: Mapping[str, Any],
     make: Optional[str],
     model: Optional[str],
     model_weight: str,
@@ -837,9 +970,9 @@ def build_survey_pdf(
         logo_path=settings_logo_path,
     )
 
-    # Smaller hero image
+    # Smaller hero image (center_image's stat doubles as the existence check)
     try:
-        if image_path and os.path.exists(image_path):
+        if image_path:
             center_image(pdf, image_path, max_w=85)
     except Exception:
         # Keep behavior: silently ignore image errors
@@ -847,8 +980,7 @@ def build_survey_pdf(
 
     # --- Equipment Info (wrapped two-pair rows) ---
     section_header(pdf, "Equipment Info")
-    dims = f"{model_width} x {model_depth} x {model_height}"
-    dims = nbsp_units(dims)
+    dims = equipment_dims_text(str(model_width), str(model_depth), str(model_height))
     kv_row_two_pairs_wrapped(pdf, "Make", make, "Model", model, label_w=28)
     kv_row_two_pairs_wrapped(
         pdf,
@@ -868,14 +1000,14 @@ def build_survey_pdf(
     write_contact_info(pdf, sections_used, answers, lang_map, category, make, model)
 
     # --- Hours of Operation (no seconds) ---
-    ensure_space(pdf, needed=90)
+    ensure_space_for(pdf, 90)
     section_header(pdf, "Hours of Operation")
     hours_table(pdf, hours)
     pdf.ln(SPACE_AFTER_BLOCK)
     draw_hr(pdf)
 
     # --- Delivery Instructions (clean fixed two-cell Q/A rows) ---
-    ensure_glue(pdf, min_after=26)
+    ensure_space_for(pdf, 26)
     printed_delivery_header = False
     for _sec in sections_used:
         if _sec.get("key") in ("delivery_base", "smart_safe_additions"):
@@ -894,7 +1026,7 @@ def build_survey_pdf(
             printed_delivery_header = True
 
     # --- Installation Details (clean fixed two-cell Q/A rows) ---
-    ensure_glue(pdf, min_after=26)
+    ensure_space_for(pdf, 26)
     for _sec in sections_used:
         if _sec.get("key") == "installation_location":
             write_section_to_pdf_QA(
@@ -911,34 +1043,43 @@ def build_survey_pdf(
             break
 
     # --- Photos: one per page ---
-    if accepted_photos:
-        for photo in accepted_photos[: max_count]:
-            temp_path: Optional[str] = None
-            try:
-                pdf.add_page()
-                section_header(pdf, "Site Survey Photo")
-                img = Image.open(photo).convert("RGB")
-                temp_path = f"temp_{photo.name}.jpg"
-                img.save(temp_path, format="JPEG")
-                img.close()
-
-                y_top = pdf.get_y()
-                max_w = pdf.w - pdf.l_margin - pdf.r_margin
-                max_h = pdf.h - y_top - pdf.b_margin - 5
-                center_image(pdf, temp_path, max_w=max_w, max_h=max_h, y_top=y_top)
-            except Exception:
-                pdf.set_font("Helvetica", "B", 11)
-                set_text_color(pdf, (200, 0, 0))
-                pdf.cell(
-                    0,
-                    H_ROW,
-                    text=sanitize(f"Error displaying image {photo.name}"),
-                    new_x=XPos.LMARGIN,
-                    new_y=YPos.NEXT,
-                )
-            finally:
-                if temp_path and os.path.exists(temp_path):
-                    os.remove(temp_path)
+    photos = accepted_photos[: max_count] if accepted_photos else []
+    if photos:
+        # Encoding runs on the pool; FPDF isn't thread-safe, so pages are
+        # still laid out here in upload order as each result comes back.
+        workers = min(PHOTO_WORKERS, os.cpu_count() or 1, len(photos))
+        # Margins are fixed for the whole document, so the width box is too
+        max_w = usable_width(pdf)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: List[Optional[Future]] = []
+            for i, photo in enumerate(photos, start=1):
+                try:
+                    pdf.add_page()
+                    section_header(pdf, "Site Survey Photo")
+                    y_top = pdf.get_y()
+                    max_h = pdf.h - y_top - pdf.b_margin - 5
+                    if not pending:
+                        # Every photo page has the same header, so the first
+                        # one fixes the pixel box for all of them (mm -> px)
+                        target = (int(max_w / 25.4 * PHOTO_DPI), int(max_h / 25.4 * PHOTO_DPI))
+                        pending = [pool.submit(_encode_photo, p, target) for p in photos]
+                    buf, size = pending[i - 1].result()
+                    pending[i - 1] = None  # drop the buffer once embedded
+
+                    center_image(pdf, buf, max_w=max_w, max_h=max_h, y_top=y_top, size=size)
+                except Exception:
+                    pdf.set_font("Helvetica", "B", 11)
+                    set_text_color(pdf, (200, 0, 0))
+                    pdf.cell(
+                        0,
+                        H_ROW,
+                        text=sanitize(f"Error displaying image {photo.name}"),
+                        new_x=XPos.LMARGIN,
+                        new_y=YPos.NEXT,
+                    )
+                finally:
+                    if i % PHOTO_GC_EVERY == 0:
+                        gc.collect()
 
     # Footer
     pdf.set_y(-18)
@@ -948,18 +1089,15 @@ def build_survey_pdf(
     pdf.cell(
         0,
         8,
-        text=sanitize(
-            "Generated by Site Survey App - Version 1.0 - © 2025"
-        ),
+        text=FOOTER_TEXT,
         align="C",
         new_x=XPos.LMARGIN,
         new_y=YPos.NEXT,
     )
 
-    # Streamlit download payload
-    buf = BytesIO()
-    pdf.output(buf)
-    pdf_bytes = buf.getvalue()
+    # Streamlit download payload. fpdf2 returns a bytearray; st.download_button
+    # (streamlit<1.40) only takes bytes, so convert once with no BytesIO hop.
+    pdf_bytes = bytes(pdf.output())
 
     # -------- Dynamic PDF filename --------
     # Use Company Name and Site ID from the answers/validate_state
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from collections import ChainMap
+from typing import Any, Dict, List, Mapping
 
 
 def _coerce_number(x: Any):
@@ -91,7 +92,7 @@ def _op_eval(lhs: Any, op: str, rhs: Any) -> bool:
     return False
 
 
-def _eval_clause(ctx: Dict[str, Any], clause: Dict[str, Any]) -> bool:
+def _eval_clause(ctx: Mapping[str, Any], clause: Dict[str, Any]) -> bool:
     fld = clause.get("field")
     op = clause.get("op", "eq")
     val = clause.get("value")
@@ -99,7 +100,7 @@ def _eval_clause(ctx: Dict[str, Any], clause: Dict[str, Any]) -> bool:
     return _op_eval(lhs, op, val)
 
 
-def evaluate(cond: Any, state: Dict[str, Any], category: str | None = None, make: str | None = None, model: str | None = None) -> bool:
+def evaluate(cond: Any, state: Mapping[str, Any], category: str | None = None, make: str | None = None, model: str | None = None) -> bool:
     """
     Evaluate a visible_if object against the current state with virtual fields injected.
     Supported group objects:
@@ -111,20 +112,28 @@ def evaluate(cond: Any, state: Dict[str, Any], category: str | None = None, make
     if not cond:
         return True
 
-    # Build context with virtual fields
-    ctx: Dict[str, Any] = dict(state or {})
+    # Overlay virtual fields on the caller's state instead of copying it
+    virtual: Dict[str, Any] = {}
     if category is not None:
-        ctx["__category__"] = category
+        virtual["__category__"] = category
     if make is not None:
-        ctx["__make__"] = make
+        virtual["__make__"] = make
     if model is not None:
-        ctx["__model__"] = model
+        virtual["__model__"] = model
+    ctx: Mapping[str, Any] = ChainMap(virtual, state) if state is not None else virtual
+
+    return _eval_cond(cond, ctx)
+
+
+def _eval_cond(cond: Any, ctx: Mapping[str, Any]) -> bool:
+    if not cond:
+        return True
 
     # Group: all
     if isinstance(cond, dict) and "all" in cond:
         subs = cond.get("all") or []
         for sub in subs:
-            if not evaluate(sub, ctx, category, make, model):
+            if not _eval_cond(sub, ctx):
                 return False
         return True
 
@@ -132,7 +141,7 @@ def evaluate(cond: Any, state: Dict[str, Any], category: str | None = None, make
     if isinstance(cond, dict) and "any" in cond:
         subs = cond.get("any") or []
         for sub in subs:
-            if evaluate(sub, ctx, category, make, model):
+            if _eval_cond(sub, ctx):
                 return True
         return False
 
@@ -143,7 +152,7 @@ def evaluate(cond: Any, state: Dict[str, Any], category: str | None = None, make
     # Lists are treated as implicit "all"
     if isinstance(cond, list):
         for sub in cond:
-            if not evaluate(sub, ctx, category, make, model):
+            if not _eval_cond(sub, ctx):
                 return False
         return True
 
@@ -151,5 +160,5 @@ def evaluate(cond: Any, state: Dict[str, Any], category: str | None = None, make
     return True
 
 
-def is_visible(field_def: Dict[str, Any], state: Dict[str, Any], category: str | None = None, make: str | None = None, model: str | None = None) -> bool:
+def is_visible(field_def: Dict[str, Any], state: Mapping[str, Any], category: str | None = None, make: str | None = None, model: str | None = None) -> bool:
     return evaluate(field_def.get("visible_if"), state, category, make, model)